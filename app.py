@@ -1,49 +1,61 @@
 """Delta Drive Workshop Setup - Databricks App Entry Point."""
 
 import dash
-from dash import html, dcc, Input, Output, State, callback, dash_table
+from dash import (
+    html, dcc, Input, Output, State, ClientsideFunction, DiskcacheManager, callback, dash_table
+)
 import dash_ag_grid as dag
 import dash_bootstrap_components as dbc
+import base64
+import diskcache
+import functools
+import hashlib
+import io
 import json
 import os
 import logging
+import secrets
+import threading
+import time
+from datetime import timedelta
+import numpy as np
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from cryptography.fernet import Fernet, InvalidToken
+from config import Config
 
-from infrastructure.resource_manager import SQLWarehouseManager
-from databricks.sdk import WorkspaceClient
-
-# Global variable to track created warehouses during session
-created_warehouses = []
+# The Databricks SDK is slow to import, so it (and SQLWarehouseManager, which
+# pulls it in) is imported inside the callbacks that need it rather than here;
+# the shared client factory only loads the SDK on first use
+from infrastructure.workspace import create_pat_workspace_client
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Helper: build a PAT-auth WorkspaceClient and avoid OAuth/PAT conflicts
-def create_pat_workspace_client(hostname: str, access_token: str) -> WorkspaceClient:
-    oauth_env_vars = [
-        "DATABRICKS_CLIENT_ID",
-        "DATABRICKS_CLIENT_SECRET",
-        "DATABRICKS_OAUTH_TOKEN",
-    ]
-    saved_env: dict[str, str] = {}
-    for var in oauth_env_vars:
-        if var in os.environ:
-            saved_env[var] = os.environ[var]
-            del os.environ[var]
+# Seconds SCIM user listings are kept, keyed by sha256(hostname:token), so repeat clicks skip
+# the directory scan. Separate from main.py's Config.USER_CACHE_TTL, which is a different cache.
+SETUP_SCIM_USERS_TTL = int(os.getenv("SETUP_SCIM_USERS_TTL", "60"))
 
-    clean_hostname = hostname.replace("https://", "").replace("http://", "")
-    normalized_host = f"https://{clean_hostname}"
+# Users per SCIM page; set explicitly so paging does not depend on the SDK release default
+SCIM_USERS_PAGE_SIZE = 10000
 
-    try:
-        client = WorkspaceClient(host=normalized_host, token=access_token, auth_type="pat")
-        return client
-    finally:
-        for var, value in saved_env.items():
-            os.environ[var] = value
+# Disk-backed cache shared by background callback jobs, which run in separate processes.
+# Defaults to cache/ next to this file, so it doesn't depend on the launch directory.
+background_cache = diskcache.Cache(
+    os.getenv("DASH_CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache"))
+)
+background_callback_manager = DiskcacheManager(background_cache)
 
 # Initialize Dash app for Databricks deployment
-app = dash.Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP], suppress_callback_exceptions=True)
+app = dash.Dash(
+    __name__,
+    external_stylesheets=[dbc.themes.BOOTSTRAP],
+    suppress_callback_exceptions=True,
+    background_callback_manager=background_callback_manager,
+    # Gzip callback responses; leaderboard pages and component trees shrink several-fold
+    compress=True
+)
 server = app.server  # This is needed for Databricks Apps
 
 # T-shirt size options based on Databricks documentation
@@ -59,6 +71,13 @@ WAREHOUSE_SIZES = [
     {"label": "4X-Large (256 workers)", "value": "4X-Large"}
 ]
 
+# Auto-stop options in minutes
+AUTO_STOP_OPTIONS = [
+    {"label": "2 Hours", "value": 120},
+    {"label": "4 Hours", "value": 240},
+    {"label": "8 Hours", "value": 480}
+]
+
 def create_warehouse_creation_form():
     """Create the SQL warehouse creation form (serverless only)."""
     return dbc.Card([
@@ -90,11 +109,7 @@ def create_warehouse_creation_form():
             dbc.Label("Auto Stop", html_for="auto-stop"),
             dbc.Select(
                 id="auto-stop",
-                options=[
-                    {"label": "2 Hours", "value": 120},
-                    {"label": "4 Hours", "value": 240},
-                    {"label": "8 Hours", "value": 480}
-                ],
+                options=AUTO_STOP_OPTIONS,
                 value=240,  # Default to 4 hours
                 className="mb-3"
             ),
@@ -143,7 +158,7 @@ def create_user_management_section():
             html.Div([
                 html.Div([
                     html.H6([
-                        html.I(className="bi bi-trophy-fill me-2", style={"color": "#ffc107"}),
+                        html.I(className="bi bi-trophy-fill me-2 trophy-icon"),
                         "Workshop Leaderboard - Database Mode"
                     ], className="mb-3 text-center"),
                     
@@ -172,6 +187,9 @@ def create_user_management_section():
                 ])
             ], id="users-table-container", className="mt-3"),
             
+            # Progress updates from the background initialize callback
+            html.Div(id="leaderboard-progress", className="text-center mt-3"),
+            
             html.Div(id="fetch-users-message", className="text-center mt-3")
         ])
     ])
@@ -182,6 +200,9 @@ app.layout = html.Div([
     dcc.Location(id="url"),
     dcc.Store(id="conn-store", storage_type="local"),
     dcc.Store(id="uc-store", storage_type="local"),
+    # Warehouses created from this browser tab; 'Stop & Delete All' only cleans up these,
+    # not warehouses created by other facilitators or other tabs
+    dcc.Store(id="created-warehouses", data=[], storage_type="session"),
     html.H1("🏗️ Delta Drive Workshop Setup", className="text-center text-success mb-4"),
     html.Hr(),
     
@@ -318,51 +339,48 @@ def route_pages(pathname, hostname, access_token, catalog_name, schema_name, tab
     ], fluid=True)
 
 @app.callback(
-    Output("warehouse-creation-message", "children"),
+    [Output("warehouse-creation-message", "children"),
+     Output("created-warehouses", "data")],
     Input("create-warehouse-btn", "n_clicks"),
     [State("hostname", "value"),
      State("access-token", "value"),
      State("warehouse-name", "value"),
      State("cluster-size", "value"),
      State("auto-stop", "value"),
-     State("warehouse-count", "value")]
+     State("warehouse-count", "value"),
+     State("created-warehouses", "data")]
 )
-def create_sql_warehouse(n_clicks, hostname, access_token, warehouse_name, cluster_size, auto_stop, warehouse_count):
+def create_sql_warehouse(n_clicks, hostname, access_token, warehouse_name, cluster_size, auto_stop, warehouse_count, tracked_warehouses):
     """Handle serverless SQL warehouse creation using the resource manager."""
     if not n_clicks:
-        return ""
+        return "", dash.no_update
     
     # Validate inputs
     if not all([hostname, access_token, warehouse_name, cluster_size]):
-        return dbc.Alert("❌ Please fill in all required fields", color="danger")
+        return dbc.Alert("❌ Please fill in all required fields", color="danger"), dash.no_update
     
     try:
         # Convert warehouse_count to integer and validate
         try:
             warehouse_count = int(warehouse_count) if warehouse_count else 1
             if warehouse_count < 1 or warehouse_count > 5:
-                return dbc.Alert("❌ Number of warehouses must be between 1 and 5", color="danger")
+                return dbc.Alert("❌ Number of warehouses must be between 1 and 5", color="danger"), dash.no_update
         except (ValueError, TypeError):
-            return dbc.Alert("❌ Please enter a valid number for warehouse count", color="danger")
+            return dbc.Alert("❌ Please enter a valid number for warehouse count", color="danger"), dash.no_update
         
         # Convert auto_stop to integer
         try:
             auto_stop = int(auto_stop) if auto_stop else 240
         except (ValueError, TypeError):
-            return dbc.Alert("❌ Invalid auto-stop value", color="danger")
+            return dbc.Alert("❌ Invalid auto-stop value", color="danger"), dash.no_update
         
         # Initialize the SQL warehouse manager
+        from infrastructure.resource_manager import SQLWarehouseManager
         warehouse_manager = SQLWarehouseManager(hostname, access_token)
         
         # Create warehouses using the resource manager
         logger.info(f"Creating {warehouse_count} warehouse(s) with name '{warehouse_name}' and size '{cluster_size}'")
-        
-        # Show progress message
-        progress_message = dbc.Alert([
-            dbc.Spinner(size="sm"),
-            f" Creating {warehouse_count} serverless warehouse(s)..."
-        ], color="info")
-        
+
         results = warehouse_manager.create_multiple_warehouses(
             base_name=warehouse_name,
             cluster_size=cluster_size,
@@ -374,14 +392,15 @@ def create_sql_warehouse(n_clicks, hostname, access_token, warehouse_name, clust
         successful_warehouses = [r for r in results if r.success]
         failed_warehouses = [r for r in results if not r.success]
         
-        # Store created warehouse IDs in global list for tracking
-        global created_warehouses
-        for warehouse in successful_warehouses:
-            created_warehouses.append({
+        # Track created warehouse IDs in this browser session's store
+        tracked_warehouses = (tracked_warehouses or []) + [
+            {
                 'id': warehouse.id,
                 'name': warehouse.name,
                 'http_path': warehouse.http_path
-            })
+            }
+            for warehouse in successful_warehouses
+        ]
         
         # Convert minutes to hours for display
         auto_stop_hours = auto_stop // 60
@@ -418,9 +437,9 @@ def create_sql_warehouse(n_clicks, hostname, access_token, warehouse_name, clust
                 html.H6("📋 Connection Details:", className="text-success"),
                 *warehouse_details,
                 html.Hr(),
-                html.P(f"📊 Total warehouses being tracked: {len(created_warehouses)}", className="mb-1"),
+                html.P(f"📊 Total warehouses being tracked: {len(tracked_warehouses)}", className="mb-1"),
                 html.P("Use the red '🗑️ Stop & Delete All' button to clean up all resources when done", className="mb-0 text-muted")
-            ], color="success" if not failed_warehouses else "warning")
+            ], color="success" if not failed_warehouses else "warning"), tracked_warehouses
         
         else:
             # All warehouses failed
@@ -434,13 +453,148 @@ def create_sql_warehouse(n_clicks, hostname, access_token, warehouse_name, clust
                 *error_details,
                 html.Hr(),
                 html.P("Please check your credentials and try again.", className="small text-muted")
-            ], color="danger")
+            ], color="danger"), dash.no_update
         
     except Exception as e:
         logger.error(f"Unexpected error in warehouse creation: {str(e)}")
-        return dbc.Alert(f"❌ Unexpected error: {str(e)}", color="danger")
+        return dbc.Alert(f"❌ Unexpected error: {str(e)}", color="danger"), dash.no_update
+
+def list_active_workspace_users(hostname, access_token):
+    """List active workspace users via the SDK as parallel (ids, display names, emails, usernames) lists."""
+    # Initialize WorkspaceClient with explicit PAT auth and normalized host
+    workspace_client = create_pat_workspace_client(hostname, access_token)
+    logger.info("WorkspaceClient initialized successfully")
+    
+    # Use the official SDK users.list() method
+    logger.info("Calling workspace_client.users.list() as per official SDK documentation")
+    # No sort_by: a server-side sort makes SCIM scan the whole directory before the first page
+    users_iterator = workspace_client.users.list(
+        attributes="id,userName,displayName,emails",
+        filter="active eq true",
+        count=SCIM_USERS_PAGE_SIZE
+    )
+    
+    # Collect only the stored fields, column-wise, instead of one dict per user
+    user_ids, display_names, emails, user_names = [], [], [], []
+    user_count = 0
+    
+    for user in users_iterator:
+        user_count += 1
+        # Only log progress for first 5 users and every 1000th user
+        if user_count <= 5 or user_count % 1000 == 0:
+            logger.info("Processing user %d: %s", user_count, user.user_name or 'Unknown')
+        
+        # SDK User is a dataclass, so every field exists; unset ones are None.
+        # Inactive users are already filtered out server-side.
+        user_id = user.id or ''
+        display_name = user.display_name or ''
+        user_name = user.user_name or ''
+        
+        # The SDK always returns emails as ComplexValue objects
+        user_emails = user.emails
+        email = (user_emails[0].value or '') if user_emails else ''
+        
+        user_ids.append(user_id)
+        display_names.append(display_name)
+        emails.append(email)
+        user_names.append(user_name)
+    
+    logger.info(f"Successfully processed {len(user_ids)} active users")
+    
+    # Order by username locally, as the server-side sort used to
+    order = sorted(range(len(user_names)), key=user_names.__getitem__)
+    return (
+        [user_ids[i] for i in order],
+        [display_names[i] for i in order],
+        [emails[i] for i in order],
+        [user_names[i] for i in order]
+    )
+
+
+def get_active_workspace_users(hostname, access_token):
+    """Return active workspace users, reusing a listing fetched within the last SETUP_SCIM_USERS_TTL seconds."""
+    # Kept in the disk cache rather than process memory: the initialize callback runs
+    # in a background process, so an in-memory dict would never see a second hit
+    cache_key = "scim-users:" + hashlib.sha256(f"{hostname}:{access_token}".encode()).hexdigest()
+    cached = background_cache.get(cache_key)
+    if cached is not None:
+        logger.info(f"Using cached workspace users ({len(cached[0])} users)")
+        return cached
+    
+    users = list_active_workspace_users(hostname, access_token)
+    background_cache.set(cache_key, users, expire=SETUP_SCIM_USERS_TTL)
+    return users
+
+
+def progress_alert(message):
+    """Build the spinner alert shown in leaderboard-progress while initialization runs."""
+    return dbc.Alert([dbc.Spinner(size="sm"), f" {message}"], color="info")
+
+
+# Demo participants shown when the workspace has no users or the SDK call fails
+DEMO_USER_IDS = ('demo-user-1', 'demo-user-2', 'demo-user-3', 'demo-user-4', 'demo-user-5')
+DEMO_DISPLAY_NAMES = ('John Doe', 'Jane Smith', 'Bob Johnson', 'Digital Workshop Admin', 'Charlie Davis')
+DEMO_EMAILS = (
+    'john.doe@company.com',
+    'jane.smith@company.com',
+    'bob.johnson@company.com',
+    'admin@company.com',
+    'charlie.davis@company.com'
+)
+
+
+def create_demo_users_table():
+    """Create the users table shown with demo data when the SDK call fails."""
+    return dbc.Table([
+        html.Thead([
+            html.Tr([
+                html.Th("👤 User ID"),
+                html.Th("📝 Display Name"),
+                html.Th("📧 Email Address"),
+                html.Th("🔑 Username"),
+                html.Th("🔄 Status")
+            ])
+        ]),
+        html.Tbody([
+            html.Tr([
+                html.Td(user_id[:12] + "..." if len(user_id) > 15 else user_id),
+                html.Td(display_name),
+                html.Td(email),
+                html.Td(email),
+                html.Td('⚠️ Demo Data')
+            ]) for user_id, display_name, email in zip(DEMO_USER_IDS, DEMO_DISPLAY_NAMES, DEMO_EMAILS)
+        ])
+    ], bordered=True, hover=True, striped=True, className="mt-3")
+
 
-# Callback for fetching users from SCIM API
+# The demo table never changes, so build it once rather than on every failure
+DEMO_USERS_TABLE = create_demo_users_table()
+
+
+def discard_leaderboard_warehouse(warehouse_future, hostname, access_token):
+    """Delete a leaderboard warehouse whose initialization was abandoned.
+    
+    Returns straight away: if the warehouse is still being created, it is deleted once
+    creation finishes rather than making the caller wait up to the 5-minute start-up timeout.
+    """
+    def delete_when_created(future):
+        try:
+            warehouse_result = future.result()
+            # A reused warehouse predates this run, so leave it alone
+            if warehouse_result['success'] and not warehouse_result.get('reused'):
+                background_cache.delete(leaderboard_warehouse_cache_key(hostname))
+                create_pat_workspace_client(hostname, access_token).warehouses.delete(warehouse_result['warehouse_id'])
+                logger.info(f"Deleted unused leaderboard warehouse {warehouse_result['warehouse_name']}")
+        except Exception as e:
+            logger.warning(f"Could not clean up leaderboard warehouse: {str(e)}")
+    
+    # Nothing to clean up if creation never started
+    if not warehouse_future.cancel():
+        warehouse_future.add_done_callback(delete_when_created)
+
+
+# Callback for fetching users from SCIM API. Runs as a background callback so large
+# workspaces don't hold a web worker past its timeout; progress goes to leaderboard-progress.
 @app.callback(
     [Output("users-table-container", "children"),
      Output("fetch-users-message", "children")],
@@ -449,30 +603,28 @@ def create_sql_warehouse(n_clicks, hostname, access_token, warehouse_name, clust
      State("access-token", "value"),
      State("catalog-name", "value"),
      State("schema-name", "value"),
-     State("table-name", "value")]
+     State("table-name", "value")],
+    background=True,
+    progress=Output("leaderboard-progress", "children"),
+    running=[(Output("fetch-users-btn", "disabled"), True, False)],
+    prevent_initial_call=True
 )
-def fetch_users_from_scim(n_clicks, hostname, access_token, catalog_name, schema_name, table_name):
+def fetch_users_from_scim(set_progress, n_clicks, hostname, access_token, catalog_name, schema_name, table_name):
     """Fetch users from Databricks workspace using the official SDK users.list() method."""
     logger.info(f"=== FETCH USERS CALLBACK START ===")
     logger.info(f"n_clicks={n_clicks}, hostname_provided={hostname is not None}, token_provided={access_token is not None}")
     
     if not n_clicks:
-        logger.info("No clicks detected, returning empty values")
-        return "", ""
-    
-    # Show loading state immediately
-    loading_message = dbc.Alert([
-        dbc.Spinner(size="sm"),
-        " 🔄 Fetching users from workspace... This may take a moment for large workspaces."
-    ], color="info")
-    logger.info("Showing loading state to user")
+        logger.info("No clicks detected, leaving outputs unchanged")
+        return dash.no_update, dash.no_update
     
     # Validate inputs
     if not all([hostname, access_token]):
         error_msg = "❌ Please fill in hostname and access token"
         logger.warning(error_msg)
         logger.info(f"Returning validation error: {error_msg}")
-        return "", dbc.Alert(error_msg, color="danger")
+        # Only the message changes; skip re-rendering the table
+        return dash.no_update, dbc.Alert(error_msg, color="danger")
     
     # Default UC names if not provided
     catalog_name = catalog_name or "main"
@@ -484,223 +636,75 @@ def fetch_users_from_scim(n_clicks, hostname, access_token, catalog_name, schema
     logger.info("✅ Validation passed, proceeding with user fetch")
     
     logger.info(f"Fetching users from Databricks workspace: {hostname}")
+    set_progress(progress_alert("🔄 Fetching users from workspace... This may take a moment for large workspaces."))
+    
+    # The SCIM listing and the warehouse start-up are independent waits, so start the
+    # warehouse in the background while users are listed
+    warehouse_executor = ThreadPoolExecutor(max_workers=1)
+    warehouse_future = warehouse_executor.submit(create_leaderboard_warehouse, hostname, access_token)
+    warehouse_executor.shutdown(wait=False)
+    warehouse_result = None
     
     try:
-        # Initialize WorkspaceClient with explicit PAT auth and normalized host
-        workspace_client = create_pat_workspace_client(hostname, access_token)
-        logger.info("WorkspaceClient initialized successfully")
-        
-        # Use the official SDK users.list() method
-        logger.info("Calling workspace_client.users.list() as per official SDK documentation")
-        users_iterator = workspace_client.users.list(
-            attributes="id,userName,displayName,emails,active",
-            sort_by="userName"
-        )
-        
-        # Convert iterator to list and process users
-        users_data = []
-        user_count = 0
-        
-        for user in users_iterator:
-            user_count += 1
-            # Only log progress for first 5 users and every 1000th user
-            if user_count <= 5 or user_count % 1000 == 0:
-                logger.info(f"Processing user {user_count}: {getattr(user, 'user_name', 'Unknown')}")
-            
-            # Check if user is active (default to True if not specified)
-            is_active = getattr(user, 'active', True)
-            
-            if is_active:
-                # Extract user information safely
-                user_id = getattr(user, 'id', '')
-                display_name = getattr(user, 'display_name', '')
-                user_name = getattr(user, 'user_name', '')
-                
-                # Extract email from emails array
-                email = ""
-                emails = getattr(user, 'emails', [])
-                if emails and len(emails) > 0:
-                    # Handle both list and ComplexValue formats
-                    first_email = emails[0]
-                    if hasattr(first_email, 'value'):
-                        email = first_email.value
-                    elif isinstance(first_email, dict):
-                        email = first_email.get('value', '')
-                    else:
-                        email = str(first_email)
-                
-                users_data.append({
-                    'ID': user_id,
-                    'Display Name': display_name,
-                    'Email': email,
-                    'Username': user_name,
-                    'Status': '✅ Active'
-                })
-                
-                logger.info(f"Added active user: {user_name} ({email})")
-        
-        logger.info(f"Successfully processed {len(users_data)} active users from {user_count} total users")
+        user_ids, display_names, emails, user_names = get_active_workspace_users(hostname, access_token)
         
         # If no users found, fall back to demo data
-        if not users_data:
+        is_demo_data = not user_ids
+        if is_demo_data:
             logger.warning("No active users found in workspace, falling back to demo data")
-            users_data = [
-                {
-                    'ID': 'demo-user-1',
-                    'Display Name': 'John Doe',
-                    'Email': 'john.doe@company.com',
-                    'Username': 'john.doe@company.com',
-                    'Status': '⚠️ Demo Data'
-                },
-                {
-                    'ID': 'demo-user-2',
-                    'Display Name': 'Jane Smith',
-                    'Email': 'jane.smith@company.com',
-                    'Username': 'jane.smith@company.com',
-                    'Status': '⚠️ Demo Data'
-                },
-                {
-                    'ID': 'demo-user-3',
-                    'Display Name': 'Bob Johnson',
-                    'Email': 'bob.johnson@company.com',
-                    'Username': 'bob.johnson@company.com',
-                    'Status': '⚠️ Demo Data'
-                },
-                {
-                    'ID': 'demo-user-4',
-                    'Display Name': 'Digital Workshop Admin',
-                    'Email': 'admin@company.com',
-                    'Username': 'admin@company.com',
-                    'Status': '⚠️ Demo Data'
-                },
-                {
-                    'ID': 'demo-user-5',
-                    'Display Name': 'Charlie Davis',
-                    'Email': 'charlie.davis@company.com',
-                    'Username': 'charlie.davis@company.com',
-                    'Status': '⚠️ Demo Data'
-                }
-            ]
-
-        # Create the leaderboard-themed users table with scroll functionality
-        display_limit = 200  # Increased limit for better leaderboard view
-        display_users = users_data[:display_limit]
-        logger.info(f"Creating leaderboard table with {len(display_users)} displayed users (out of {len(users_data)} total)")
-        
-        table_rows = []
-        for i, user in enumerate(display_users):
-            if i < 5:  # Only log first 5 users to avoid spam
-                logger.info(f"Creating leaderboard row {i+1}: {user.get('Display Name', 'No name')} ({user.get('Email', 'No email')})")
-            
-            # Initialize score as 0 for new participants
-            initial_score = 0
-            
-            table_rows.append(
-                html.Tr([
-                    html.Td(f"#{i+1}", style={"font-weight": "bold", "color": "#0d6efd"}),  # Rank
-                    html.Td(user['Display Name'], style={"font-weight": "500"}),
-                    html.Td(user['Email'], style={"color": "#6c757d"}),
-                    html.Td("✅ Yes" if user['Status'] == '✅ Active' else "❌ No", 
-                           style={"color": "#198754" if user['Status'] == '✅ Active' else "#dc3545"}),
-                    html.Td(f"{initial_score} pts", style={"font-weight": "bold", "color": "#198754"})
-                ])
-            )
-        
-        # Create scrollable table container with leaderboard styling
-        users_table = html.Div([
-            html.H5([
-                html.I(className="bi bi-trophy-fill me-2", style={"color": "#ffc107"}),
-                f"Workshop Leaderboard - {len(display_users)} Participants"
-            ], className="mb-3"),
-            
-            html.Div([
-                dbc.Table([
-                    html.Thead([
-                        html.Tr([
-                            html.Th("🏆 Rank", style={"background-color": "#f8f9fa", "border-bottom": "2px solid #dee2e6"}),
-                            html.Th("👤 Participant Name", style={"background-color": "#f8f9fa", "border-bottom": "2px solid #dee2e6"}),
-                            html.Th("📧 Email Address", style={"background-color": "#f8f9fa", "border-bottom": "2px solid #dee2e6"}),
-                            html.Th("📊 Active on Workspace", style={"background-color": "#f8f9fa", "border-bottom": "2px solid #dee2e6"}),
-                            html.Th("🎯 Current Score", style={"background-color": "#f8f9fa", "border-bottom": "2px solid #dee2e6"})
-                        ])
-                    ]),
-                    html.Tbody(table_rows)
-                ], bordered=True, hover=True, striped=True, responsive=True)
-            ], style={
-                "max-height": "500px", 
-                "overflow-y": "auto", 
-                "border": "1px solid #dee2e6",
-                "border-radius": "8px"
-            })
-        ], className="mt-3")
-        
-        logger.info(f"Leaderboard table created successfully with {len(table_rows)} participant rows")
+            user_ids = list(DEMO_USER_IDS)
+            display_names = list(DEMO_DISPLAY_NAMES)
+            emails = list(DEMO_EMAILS)
+            user_names = list(DEMO_EMAILS)
+        
+        participant_count = len(user_ids)
+        
+        # Build the leaderboard DataFrame in one shot from the columns; scalars broadcast.
+        # Numeric columns are pre-typed int32 arrays so pandas skips dtype inference.
+        logger.info(f"Converting {participant_count} users to DataFrame")
+        participants_df = pd.DataFrame({
+            'participant_id': user_ids,
+            'rank': np.arange(1, participant_count + 1, dtype=np.int32),
+            'display_name': display_names,
+            'email': emails,
+            'username': user_names,
+            'is_active': not is_demo_data,
+            'status': 'Inactive' if is_demo_data else 'Active',
+            'score': np.zeros(participant_count, dtype=np.int32),  # Initialize all scores to 0
+            'last_updated': pd.Timestamp.now()
+        })
+        logger.info(f"Created DataFrame with {len(participants_df)} participants")
 
-        # Check if we're showing demo data
-        is_demo_data = any(user.get('Status', '').startswith('⚠️') for user in users_data)
-        
+        # The rendered leaderboard is the warehouse-backed AG Grid (virtualized, paged on demand)
+        # or the fallback table below, so no per-row components are built here
         if is_demo_data:
             success_message = dbc.Alert([
                 html.H6("⚠️ Demo Data Displayed", className="alert-heading"),
-                html.P(f"Unable to fetch real users from workspace. Showing {len(users_data)} demo users instead."),
+                html.P(f"Unable to fetch real users from workspace. Showing {participant_count} demo users instead."),
                 html.P("This may be due to API permissions or network restrictions in the deployed environment."),
                 html.P("In a real workshop setup, this would show actual workspace users with their email addresses.")
             ], color="warning")
         else:
-            if len(users_data) > display_limit:
-                success_message = dbc.Alert([
-                    html.H6("🎉 Leaderboard Initialized Successfully!", className="alert-heading"),
-                    html.P(f"🏆 Found {len(users_data)} eligible participants in the workspace"),
-                    html.P(f"📊 Displaying top {display_limit} participants in the leaderboard below"),
-                    html.P("🎯 All participants start with 0 points. Scores will update as workshop activities are completed!")
-                ], color="success")
-            else:
-                success_message = dbc.Alert([
-                    html.H6("🎉 Leaderboard Initialized Successfully!", className="alert-heading"),
-                    html.P(f"🏆 Found {len(users_data)} eligible participants in the workspace"),
-                    html.P("🎯 All participants start with 0 points. Scores will update as workshop activities are completed!")
-                ], color="success")
+            success_message = dbc.Alert([
+                html.H6("🎉 Leaderboard Initialized Successfully!", className="alert-heading"),
+                html.P(f"🏆 Found {participant_count} eligible participants in the workspace"),
+                html.P("📊 All participants are paged into the leaderboard below as you scroll"),
+                html.P("🎯 All participants start with 0 points. Scores will update as workshop activities are completed!")
+            ], color="success")
         
         logger.info(f"=== CALLBACK RETURN PREPARATION ===")
-        logger.info(f"📊 Returning leaderboard with {len(display_users)} displayed participants (out of {len(users_data)} total)")
-        logger.info(f"🏆 Users table type: {type(users_table)}")
         logger.info(f"✅ Success message type: {type(success_message)}")
-        logger.info(f"👥 First few participants: {users_data[:2] if users_data else 'No users'}")
-        
-        # Verify the table structure
-        if hasattr(users_table, 'children') and users_table.children:
-            logger.info(f"📋 Table structure verified: {len(users_table.children)} components")
-        else:
-            logger.warning("⚠️  Table structure may be incorrect")
+        logger.info(f"👥 First few participants: {display_names[:2]}")
         
         logger.info("🔄 Executing callback return...")
         
-        # Convert users to DataFrame for database storage
-        logger.info(f"Converting {len(users_data)} users to DataFrame")
-        
-        # Create DataFrame with leaderboard structure
-        df_data = []
-        for i, user in enumerate(users_data):
-            df_data.append({
-                'participant_id': user['ID'],
-                'rank': i + 1,
-                'display_name': user['Display Name'],
-                'email': user['Email'],
-                'username': user['Username'],
-                'is_active': user['Status'] == '✅ Active',
-                'status': 'Active' if user['Status'] == '✅ Active' else 'Inactive',
-                'score': 0,  # Initialize all scores to 0
-                'last_updated': pd.Timestamp.now()
-            })
-        
-        participants_df = pd.DataFrame(df_data)
-        logger.info(f"Created DataFrame with {len(participants_df)} participants")
-        
-        # Create dedicated serverless warehouse for leaderboard
-        warehouse_result = create_leaderboard_warehouse(hostname, access_token, catalog_name)
+        # Wait for the dedicated serverless warehouse started above
+        set_progress(progress_alert(f"🏗️ Preparing leaderboard warehouse for {participant_count} participants..."))
+        warehouse_result = warehouse_future.result()
         
         if warehouse_result['success']:
             # Store DataFrame in the newly created warehouse
+            set_progress(progress_alert(f"💾 Storing {participant_count} participants in {catalog_name}.{schema_name}.{table_name}..."))
             storage_result = store_leaderboard_in_warehouse(
                 participants_df, 
                 hostname, 
@@ -719,7 +723,7 @@ def fetch_users_from_scim(n_clicks, hostname, access_token, catalog_name, schema
                     html.P(f"✅ Created dedicated serverless warehouse: {warehouse_result['warehouse_name']}"),
                     html.P(f"⚙️ Configuration: XL size, 8-hour autostop, serverless"),
                     html.P(f"🗃️ Using table: {catalog_name}.{schema_name}.{table_name}"),
-                    html.P(f"📊 Stored {len(users_data)} participants in table: {storage_result['table_name']}"),
+                    html.P(f"📊 Stored {participant_count} participants in table: {storage_result['table_name']}"),
                     html.P("🎯 Real-time leaderboard is now ready for workshop activities!")
                 ], color="success")
                 
@@ -734,7 +738,7 @@ def fetch_users_from_scim(n_clicks, hostname, access_token, catalog_name, schema
                     html.P("Please try initializing again...")
                 ], color="warning")
                 
-                fallback_table = create_simple_leaderboard_table(users_data[:20])
+                fallback_table = create_simple_leaderboard_table(participants_df.head(20))
                 return fallback_table, error_message
         else:
             # Warehouse creation failed
@@ -745,7 +749,7 @@ def fetch_users_from_scim(n_clicks, hostname, access_token, catalog_name, schema
             ], color="danger")
             
             # Create simple fallback table
-            fallback_table = create_simple_leaderboard_table(users_data[:20])
+            fallback_table = create_simple_leaderboard_table(participants_df.head(20))
             return fallback_table, error_message
 
     except Exception as e:
@@ -755,67 +759,13 @@ def fetch_users_from_scim(n_clicks, hostname, access_token, catalog_name, schema
         import traceback
         logger.error(f"Traceback: {traceback.format_exc()}")
         
+        # The warehouse was started alongside the user listing; don't leave it running unused
+        if warehouse_result is None:
+            discard_leaderboard_warehouse(warehouse_future, hostname, access_token)
+        
         # Fall back to demo data on any error
         logger.info("Falling back to demo data due to SDK error")
-        users_data = [
-            {
-                'ID': 'demo-user-1',
-                'Display Name': 'John Doe',
-                'Email': 'john.doe@company.com',
-                'Username': 'john.doe@company.com',
-                'Status': '⚠️ Demo Data'
-            },
-            {
-                'ID': 'demo-user-2',
-                'Display Name': 'Jane Smith',
-                'Email': 'jane.smith@company.com',
-                'Username': 'jane.smith@company.com',
-                'Status': '⚠️ Demo Data'
-            },
-            {
-                'ID': 'demo-user-3',
-                'Display Name': 'Bob Johnson',
-                'Email': 'bob.johnson@company.com',
-                'Username': 'bob.johnson@company.com',
-                'Status': '⚠️ Demo Data'
-            },
-            {
-                'ID': 'demo-user-4',
-                'Display Name': 'Digital Workshop Admin',
-                'Email': 'admin@company.com',
-                'Username': 'admin@company.com',
-                'Status': '⚠️ Demo Data'
-            },
-            {
-                'ID': 'demo-user-5',
-                'Display Name': 'Charlie Davis',
-                'Email': 'charlie.davis@company.com',
-                'Username': 'charlie.davis@company.com',
-                'Status': '⚠️ Demo Data'
-            }
-        ]
-        
-        # Create the users table with demo data
-        users_table = dbc.Table([
-            html.Thead([
-                html.Tr([
-                    html.Th("👤 User ID"),
-                    html.Th("📝 Display Name"),
-                    html.Th("📧 Email Address"),
-                    html.Th("🔑 Username"),
-                    html.Th("🔄 Status")
-                ])
-            ]),
-            html.Tbody([
-                html.Tr([
-                    html.Td(user['ID'][:12] + "..." if len(user['ID']) > 15 else user['ID']),
-                    html.Td(user['Display Name']),
-                    html.Td(user['Email']),
-                    html.Td(user['Username']),
-                    html.Td(user['Status'])
-                ]) for user in users_data
-            ])
-        ], bordered=True, hover=True, striped=True, className="mt-3")
+        users_table = DEMO_USERS_TABLE
 
         error_alert = dbc.Alert([
             html.H6("⚠️ SDK Error - Demo Data Displayed", className="alert-heading"),
@@ -829,109 +779,105 @@ def fetch_users_from_scim(n_clicks, hostname, access_token, catalog_name, schema
 
 # Callback for auto-refreshing the leaderboard
 @app.callback(
-    Output("users-table-container", "children", allow_duplicate=True),
+    [Output("leaderboard-updated-at", "children"),
+     Output("leaderboard-participant-count", "children"),
+     Output("leaderboard-watermark", "data")],
     [Input("leaderboard-refresh-interval", "n_intervals"),
      Input("refresh-leaderboard-btn", "n_clicks")],
-    [State("hostname", "value"),
-     State("access-token", "value"),
-     State("catalog-name", "value"),
-     State("schema-name", "value"),
-     State("table-name", "value")],
+    [State("leaderboard-source", "data"),
+     State("leaderboard-watermark", "data")],
     prevent_initial_call=True
 )
-def auto_refresh_leaderboard(n_intervals, refresh_clicks, hostname, access_token, catalog_name, schema_name, table_name):
-    """Auto-refresh the leaderboard every 30 seconds or when refresh button is clicked."""
+def auto_refresh_leaderboard(n_intervals, refresh_clicks, source_id, watermark):
+    """Auto-refresh the leaderboard every 30 seconds or when refresh button is clicked.
+    
+    Each tick only polls the table's Delta version, and counts rows only when it moved. The
+    watermark store, and with it the grid refresh in the refreshLeaderboardGrid clientside
+    callback, only changes when the table did. "Refresh Now" drops the table's cached results first and
+    always rewrites the watermark, so the grid re-reads from the warehouse.
+    """
+    source = load_leaderboard_source(source_id)
+    if not source:
+        return dash.no_update, dash.no_update, dash.no_update
+    
     try:
         logger.info(f"Auto-refreshing leaderboard: intervals={n_intervals}, clicks={refresh_clicks}")
+        manual_refresh = dash.ctx.triggered_id == "refresh-leaderboard-btn"
+        if manual_refresh:
+            # "Refresh Now" reads through to the warehouse, and the grid re-pulls fresh pages
+            invalidate_leaderboard_cache(source["hostname"], source["table"])
+        updated_at = f"Updated: {time.strftime('%H:%M:%S')}"
+        latest_version = read_leaderboard_version(
+            source["hostname"], source["access_token"], source["warehouse_id"], source["table"]
+        )
+        if watermark and latest_version == watermark.get("version") and not manual_refresh:
+            logger.info("Leaderboard unchanged since last refresh")
+            return updated_at, dash.no_update, dash.no_update
         
-        # Check if we have credentials
-        if not all([hostname, access_token]):
-            return html.Div([
-                html.P("⚠️ Leaderboard auto-refresh requires workspace credentials", 
-                       className="text-muted text-center")
-            ])
-        
-        # Default UC names
-        catalog_name = catalog_name or "main"
-        schema_name = schema_name or "default"
-        table_name = table_name or "workshop_leaderboard"
-
-        # Try to refresh the leaderboard from warehouse
-        leaderboard_ui = query_leaderboard_from_warehouse(hostname, access_token, None, catalog_name, schema_name, table_name)
+        latest_watermark = read_leaderboard_watermark(
+            source["hostname"], source["access_token"], source["warehouse_id"], source["table"]
+        )
         logger.info("Leaderboard auto-refresh successful")
-        return leaderboard_ui
+        return (
+            updated_at,
+            f"📊 {latest_watermark['count']} participants in SQL warehouse",
+            latest_watermark
+        )
         
     except Exception as e:
         logger.warning(f"Auto-refresh failed: {str(e)}")
-        # Return current content on error (don't break the UI)
-        return html.Div([
-            html.P(f"⚠️ Auto-refresh temporarily unavailable: {str(e)}", 
-                   className="text-muted text-center small")
-        ])
+        # Keep the current grid and count; only flag the failure (don't break the UI)
+        return f"⚠️ Auto-refresh temporarily unavailable: {str(e)}", dash.no_update, dash.no_update
+
+
+# Re-pull the grid's loaded pages in place whenever auto_refresh_leaderboard writes the
+# watermark: the table changed, or a manual refresh cleared the cache (see assets/clientside.js)
+app.clientside_callback(
+    ClientsideFunction(namespace="ui", function_name="refreshLeaderboardGrid"),
+    Input("leaderboard-watermark", "data"),
+    prevent_initial_call=True
+)
 
 
 # Callback for stopping and deleting all created warehouses
 @app.callback(
-    Output("warehouse-management-status", "children"),
+    [Output("warehouse-management-status", "children"),
+     Output("created-warehouses", "data", allow_duplicate=True)],
     Input("delete-all-warehouses-btn", "n_clicks"),
     [State("hostname", "value"),
-     State("access-token", "value")]
+     State("access-token", "value"),
+     State("created-warehouses", "data")],
+    prevent_initial_call=True
 )
-def stop_and_delete_all_warehouses(n_clicks, hostname, access_token):
-    """Stop and delete all warehouses created via the UI."""
+def stop_and_delete_all_warehouses(n_clicks, hostname, access_token, created_warehouses):
+    """Stop and delete all warehouses created via the UI in this browser session."""
     if not n_clicks:
-        return ""
+        return "", dash.no_update
     
     # Validate inputs
     if not all([hostname, access_token]):
-        return dbc.Alert("❌ Please fill in hostname and access token", color="danger")
-    
-    global created_warehouses
+        return dbc.Alert("❌ Please fill in hostname and access token", color="danger"), dash.no_update
     
     if not created_warehouses:
-        return dbc.Alert("📭 No warehouses to delete. Create some warehouses first!", color="info")
+        return dbc.Alert("📭 No warehouses to delete. Create some warehouses first!", color="info"), dash.no_update
     
     try:
         # Initialize the SQL warehouse manager
+        from infrastructure.resource_manager import SQLWarehouseManager
         warehouse_manager = SQLWarehouseManager(hostname, access_token)
         
-        # Show progress message
         warehouse_count = len(created_warehouses)
-        progress_message = dbc.Alert([
-            dbc.Spinner(size="sm"),
-            f" Stopping and deleting {warehouse_count} warehouse(s)..."
-        ], color="warning")
-        
-        # Stop and delete each warehouse
-        deleted_count = 0
-        failed_deletions = []
         
-        for warehouse in created_warehouses:
-            try:
-                warehouse_id = warehouse['id']
-                warehouse_name = warehouse['name']
-                
-                # First try to stop the warehouse
-                logger.info(f"Stopping warehouse: {warehouse_name} ({warehouse_id})")
-                warehouse_manager.stop_warehouse(warehouse_id)
-                
-                # Then delete the warehouse
-                logger.info(f"Deleting warehouse: {warehouse_name} ({warehouse_id})")
-                success = warehouse_manager.delete_warehouse(warehouse_id)
-                
-                if success:
-                    deleted_count += 1
-                    logger.info(f"Successfully deleted warehouse: {warehouse_name}")
-                else:
-                    failed_deletions.append(warehouse_name)
-                    logger.error(f"Failed to delete warehouse: {warehouse_name}")
-                    
-            except Exception as e:
-                failed_deletions.append(warehouse['name'])
-                logger.error(f"Error deleting warehouse {warehouse['name']}: {str(e)}")
+        # Stop then delete each warehouse, concurrently within the manager's request limit
+        logger.info("Stopping and deleting %d warehouse(s)", warehouse_count)
+        results = warehouse_manager.delete_multiple_warehouses(
+            [warehouse['id'] for warehouse in created_warehouses], stop_first=True
+        )
         
-        # Clear the created warehouses list
-        created_warehouses.clear()
+        deleted_count = sum(1 for warehouse in created_warehouses if results.get(warehouse['id']))
+        failed_deletions = [
+            warehouse['name'] for warehouse in created_warehouses if not results.get(warehouse['id'])
+        ]
         
         # Return success/error message
         if deleted_count == warehouse_count:
@@ -939,47 +885,75 @@ def stop_and_delete_all_warehouses(n_clicks, hostname, access_token):
                 html.H6("✅ All Warehouses Deleted Successfully!", className="alert-heading"),
                 html.P(f"Successfully stopped and deleted {deleted_count} warehouses"),
                 html.P("All resources have been cleaned up")
-            ], color="success")
+            ], color="success"), []
         elif deleted_count > 0:
             return dbc.Alert([
                 html.H6("⚠️ Partial Success", className="alert-heading"),
                 html.P(f"Successfully deleted {deleted_count} out of {warehouse_count} warehouses"),
                 html.P(f"Failed to delete: {', '.join(failed_deletions)}")
-            ], color="warning")
+            ], color="warning"), []
         else:
             return dbc.Alert([
                 html.H6("❌ Deletion Failed", className="alert-heading"),
                 html.P(f"Failed to delete any warehouses"),
                 html.P(f"Failed warehouses: {', '.join(failed_deletions)}")
-            ], color="danger")
+            ], color="danger"), []
             
     except Exception as e:
         logger.error(f"Error in stop_and_delete_all_warehouses: {str(e)}")
-        return dbc.Alert(f"❌ Error managing warehouses: {str(e)}", color="danger")
+        return dbc.Alert(f"❌ Error managing warehouses: {str(e)}", color="danger"), dash.no_update
 
 
-def create_leaderboard_warehouse(hostname, access_token, catalog_name):
-    """Create a dedicated serverless XL warehouse for the leaderboard."""
+def leaderboard_warehouse_cache_key(hostname):
+    """Disk-cache key remembering the dedicated leaderboard warehouse for a workspace."""
+    return ("leaderboard-warehouse", hostname)
+
+
+def reuse_leaderboard_warehouse(workspace_client, hostname):
+    """Start and return the previously created leaderboard warehouse, or None if it is gone."""
+    cache_key = leaderboard_warehouse_cache_key(hostname)
+    warehouse_id = background_cache.get(cache_key)
+    if not warehouse_id:
+        return None
+    
     try:
-        logger.info("Creating dedicated serverless warehouse for leaderboard")
+        warehouse_info = workspace_client.warehouses.get(warehouse_id)
+        state = warehouse_info.state.name if warehouse_info.state else None
+        if state in ("DELETING", "DELETED"):
+            raise RuntimeError(f"warehouse is {state}")
         
+        logger.info(f"Reusing leaderboard warehouse {warehouse_info.name} ({state})")
+        try:
+            if state == "STOPPED":
+                workspace_client.warehouses.start(warehouse_id).result(timeout=timedelta(minutes=5))
+            elif state != "RUNNING":
+                workspace_client.warehouses.wait_get_warehouse_running(warehouse_id, timeout=timedelta(minutes=5))
+        except TimeoutError:
+            logger.warning(f"Warehouse {warehouse_info.name} did not start within timeout")
+        
+        return {
+            'success': True,
+            'warehouse_id': warehouse_id,
+            'warehouse_name': warehouse_info.name,
+            'reused': True
+        }
+    except Exception as e:
+        logger.info(f"Cached leaderboard warehouse {warehouse_id} is unavailable ({str(e)}), creating a new one")
+        background_cache.delete(cache_key)
+        return None
+
+
+def create_leaderboard_warehouse(hostname, access_token):
+    """Create a dedicated serverless XL warehouse for the leaderboard, reusing the last one if it still exists."""
+    try:
         # Create Databricks WorkspaceClient using PAT auth and normalized host
         workspace_client = create_pat_workspace_client(hostname, access_token)
         
-        # Create catalog if it doesn't exist
-        try:
-            logger.info(f"Ensuring catalog '{catalog_name}' exists")
-            # First check if catalog exists
-            try:
-                catalog_info = workspace_client.catalogs.get(catalog_name)
-                logger.info(f"Catalog '{catalog_name}' already exists")
-            except Exception:
-                # Catalog doesn't exist, create it
-                logger.info(f"Creating catalog '{catalog_name}'")
-                workspace_client.catalogs.create(name=catalog_name)
-                logger.info(f"Successfully created catalog '{catalog_name}'")
-        except Exception as e:
-            logger.warning(f"Could not create catalog '{catalog_name}': {str(e)}. Proceeding with existing catalog.")
+        reused = reuse_leaderboard_warehouse(workspace_client, hostname)
+        if reused:
+            return reused
+        
+        logger.info("Creating dedicated serverless warehouse for leaderboard")
         
         # Import required classes for warehouse creation
         from databricks.sdk.service.sql import EndpointInfoWarehouseType
@@ -1003,23 +977,14 @@ def create_leaderboard_warehouse(hostname, access_token, catalog_name):
             enable_serverless_compute=True
         )
         warehouse_id = warehouse.id
+        background_cache.set(leaderboard_warehouse_cache_key(hostname), warehouse_id)
         
-        # Start the warehouse
-        logger.info(f"Starting warehouse: {warehouse_id}")
-        workspace_client.warehouses.start(warehouse_id)
-        
-        # Wait for warehouse to be running (with timeout)
-        import time
-        max_wait = 300  # 5 minutes timeout
-        start_time = time.time()
-        
-        while time.time() - start_time < max_wait:
-            warehouse_info = workspace_client.warehouses.get(warehouse_id)
-            if warehouse_info.state and warehouse_info.state.name == "RUNNING":
-                logger.info(f"Warehouse {warehouse_name} is now running")
-                break
-            time.sleep(10)  # Wait 10 seconds before checking again
-        else:
+        # Creating a warehouse also starts it; the SDK waiter polls with a short, growing
+        # interval, so a serverless warehouse is picked up seconds after it is RUNNING
+        try:
+            warehouse.result(timeout=timedelta(minutes=5))
+            logger.info(f"Warehouse {warehouse_name} is now running")
+        except TimeoutError:
             logger.warning(f"Warehouse {warehouse_name} did not start within timeout")
         
         return {
@@ -1036,6 +1001,174 @@ def create_leaderboard_warehouse(hostname, access_token, catalog_name):
         }
 
 
+# Leaderboard table columns and the SQL type each INSERT parameter is bound as
+LEADERBOARD_COLUMNS = (
+    ("participant_id", "STRING"),
+    ("rank", "INT"),
+    ("display_name", "STRING"),
+    ("email", "STRING"),
+    ("username", "STRING"),
+    ("is_active", "BOOLEAN"),
+    ("status", "STRING"),
+    ("score", "INT"),
+    ("last_updated", "TIMESTAMP"),
+)
+
+# Rows per INSERT statement; keeps each parameterized request well under the API's 16 MiB limit
+LEADERBOARD_INSERT_BATCH_SIZE = 1000
+
+# INSERT batches in flight at once; appends to a Delta table don't conflict with each other
+LEADERBOARD_INSERT_WORKERS = 4
+
+
+@functools.lru_cache(maxsize=8)
+def build_leaderboard_insert_sql(full_table_name, row_count):
+    """Return a multi-row INSERT for row_count rows using named markers :p{row}_{column}."""
+    column_names = ", ".join(name for name, _ in LEADERBOARD_COLUMNS)
+    column_indexes = range(len(LEADERBOARD_COLUMNS))
+    values_rows = ", ".join(
+        "(" + ", ".join(f":p{row}_{column}" for column in column_indexes) + ")"
+        for row in range(row_count)
+    )
+    return f"INSERT INTO {full_table_name} ({column_names}) VALUES {values_rows}"
+
+
+# Unity Catalog volume (created in the leaderboard schema) used to stage bulk loads
+LEADERBOARD_STAGING_VOLUME = "leaderboard_staging"
+
+
+def require_statement_succeeded(result, description):
+    """Raise unless a statement finished successfully within its wait_timeout."""
+    state = result.status.state.value if result.status and result.status.state else None
+    if state != "SUCCEEDED":
+        error = result.status.error.message if result.status and result.status.error else state
+        raise RuntimeError(f"{description} did not succeed: {error}")
+
+
+def load_leaderboard_from_volume(workspace_client, warehouse_id, df, catalog_name, schema_name, table_name):
+    """Sync the leaderboard table to the DataFrame with one staged CSV upload and a single MERGE."""
+    from databricks.sdk.service.catalog import VolumeType
+    
+    volume_name = f"{catalog_name}.{schema_name}.{LEADERBOARD_STAGING_VOLUME}"
+    try:
+        workspace_client.volumes.read(volume_name)
+    except Exception:
+        workspace_client.volumes.create(catalog_name, schema_name, LEADERBOARD_STAGING_VOLUME, VolumeType.MANAGED)
+    
+    # One file per table, overwritten on each load so staging never accumulates
+    staging_path = f"/Volumes/{catalog_name}/{schema_name}/{LEADERBOARD_STAGING_VOLUME}/{table_name}.csv"
+    column_names = [name for name, _ in LEADERBOARD_COLUMNS]
+    csv_bytes = df[column_names].to_csv(index=False).encode("utf-8")
+    workspace_client.files.upload(staging_path, io.BytesIO(csv_bytes), overwrite=True)
+    logger.info(f"Staged {len(df)} leaderboard rows at {staging_path}")
+    
+    # MERGE leaves the table equal to the file in one transaction but only rewrites rows
+    # that actually changed; last_updated alone doesn't count as a change
+    file_schema = ", ".join(f"{name} {sql_type}" for name, sql_type in LEADERBOARD_COLUMNS)
+    compared_columns = [name for name in column_names if name not in ("participant_id", "last_updated")]
+    load_sql = f"""
+    MERGE INTO {catalog_name}.{schema_name}.{table_name} AS t
+    USING read_files(
+      '{staging_path}',
+      format => 'csv',
+      header => true,
+      escape => '"',
+      schema => '{file_schema}'
+    ) AS s
+    ON t.participant_id = s.participant_id
+    WHEN MATCHED AND NOT ({' AND '.join(f't.{name} <=> s.{name}' for name in compared_columns)}) THEN
+      UPDATE SET {', '.join(f'{name} = s.{name}' for name in column_names)}
+    WHEN NOT MATCHED THEN
+      INSERT ({', '.join(column_names)}) VALUES ({', '.join(f's.{name}' for name in column_names)})
+    WHEN NOT MATCHED BY SOURCE THEN
+      DELETE
+    """
+    result = workspace_client.statement_execution.execute_statement(
+        warehouse_id=warehouse_id,
+        statement=load_sql,
+        wait_timeout="50s"
+    )
+    state = result.status.state.value if result.status and result.status.state else None
+    if state in ("FAILED", "CANCELED", "CLOSED"):
+        error = result.status.error.message if result.status.error else state
+        raise RuntimeError(f"Leaderboard load from {staging_path} failed: {error}")
+
+
+def insert_leaderboard_rows(workspace_client, warehouse_id, df, full_table_name):
+    """Replace the leaderboard table contents with batched parameterized INSERTs."""
+    from databricks.sdk.service.sql import StatementParameterListItem
+    
+    # Clear existing data, waiting for it to finish so it can't overlap the concurrent inserts
+    clear_sql = f"DELETE FROM {full_table_name}"
+    result = workspace_client.statement_execution.execute_statement(
+        warehouse_id=warehouse_id,
+        statement=clear_sql,
+        wait_timeout="50s"
+    )
+    # Inserting over a DELETE that is still running, or that failed, would duplicate rows
+    require_statement_succeeded(result, f"Clearing {full_table_name}")
+    
+    # Bind values as typed statement parameters; the API transmits them as strings
+    # and the warehouse handles quoting, so nothing is escaped here
+    column_values = [
+        (df[name].map({True: 'true', False: 'false'}) if sql_type == "BOOLEAN" else df[name].astype(str)).tolist()
+        for name, sql_type in LEADERBOARD_COLUMNS
+    ]
+    column_types = [sql_type for _, sql_type in LEADERBOARD_COLUMNS]
+    
+    batch_size = LEADERBOARD_INSERT_BATCH_SIZE
+    
+    def insert_batch(i):
+        batch_len = min(batch_size, len(df) - i)
+        parameters = [
+            StatementParameterListItem(name=f"p{row}_{column}", value=column_values[column][i + row], type=column_types[column])
+            for row in range(batch_len)
+            for column in range(len(column_types))
+        ]
+        
+        result = workspace_client.statement_execution.execute_statement(
+            warehouse_id=warehouse_id,
+            statement=build_leaderboard_insert_sql(full_table_name, batch_len),
+            parameters=parameters,
+            wait_timeout="50s"
+        )
+        require_statement_succeeded(result, f"Inserting rows {i}-{i + batch_len - 1} into {full_table_name}")
+        return batch_len
+    
+    # Insert data in batches, several at a time, so one batch is serialized while
+    # others are in flight instead of each waiting on the previous round-trip
+    with ThreadPoolExecutor(max_workers=LEADERBOARD_INSERT_WORKERS) as executor:
+        batch_lengths = executor.map(insert_batch, range(0, len(df), batch_size))
+        for batch_number, batch_len in enumerate(batch_lengths, 1):
+            logger.info("Inserted batch %d with %d records", batch_number, batch_len)
+
+
+# Seconds a confirmed catalog/schema is trusted before it is checked again
+UC_SCHEMA_CHECK_TTL = 3600
+
+
+def ensure_catalog_and_schema(workspace_client, hostname, catalog_name, schema_name):
+    """Create the catalog and schema if missing, skipping the checks when recently confirmed."""
+    # Remembered in the shared disk cache because initialization runs in a fresh background process
+    cache_key = ("uc-schema", hostname, catalog_name, schema_name)
+    if background_cache.get(cache_key):
+        return
+    
+    try:
+        workspace_client.schemas.get(f"{catalog_name}.{schema_name}")
+    except Exception:
+        # A missing schema may mean a missing catalog too
+        try:
+            workspace_client.catalogs.get(catalog_name)
+        except Exception:
+            logger.info(f"Creating catalog '{catalog_name}'")
+            workspace_client.catalogs.create(name=catalog_name)
+        logger.info(f"Creating schema '{catalog_name}.{schema_name}'")
+        workspace_client.schemas.create(name=schema_name, catalog_name=catalog_name)
+    
+    background_cache.set(cache_key, True, expire=UC_SCHEMA_CHECK_TTL)
+
+
 def store_leaderboard_in_warehouse(df, hostname, access_token, warehouse_id=None, catalog_name="main", schema_name="default", table_name="workshop_leaderboard"):
     """Store the leaderboard DataFrame in the specified SQL warehouse."""
     try:
@@ -1077,15 +1210,7 @@ def store_leaderboard_in_warehouse(df, hostname, access_token, warehouse_id=None
                     'error': 'No SQL warehouse available. Please create a warehouse first.'
                 }
         
-        # Ensure catalog and schema exist (idempotent)
-        try:
-            workspace_client.catalogs.get(catalog_name)
-        except Exception:
-            workspace_client.catalogs.create(name=catalog_name)
-        try:
-            workspace_client.schemas.get(f"{catalog_name}.{schema_name}")
-        except Exception:
-            workspace_client.schemas.create(name=schema_name, catalog_name=catalog_name)
+        ensure_catalog_and_schema(workspace_client, hostname, catalog_name, schema_name)
 
         # Create the full UC table name
         full_table_name = f"{catalog_name}.{schema_name}.{table_name}"
@@ -1113,46 +1238,18 @@ def store_leaderboard_in_warehouse(df, hostname, access_token, warehouse_id=None
         
         logger.info(f"Created table: {full_table_name}")
         
-        # Clear existing data
-        clear_sql = f"DELETE FROM {full_table_name}"
-        workspace_client.statement_execution.execute_statement(
-            warehouse_id=running_warehouse.id,
-            statement=clear_sql
-        )
-        
-        # Insert data in batches
-        batch_size = 1000
-        for i in range(0, len(df), batch_size):
-            batch_df = df.iloc[i:i+batch_size]
-            
-            # Create INSERT statements with proper escaping
-            values_list = []
-            for _, row in batch_df.iterrows():
-                # Escape single quotes in string values
-                participant_id = str(row['participant_id']).replace("'", "''")
-                display_name = str(row['display_name']).replace("'", "''")
-                email = str(row['email']).replace("'", "''")
-                username = str(row['username']).replace("'", "''")
-                status = str(row['status']).replace("'", "''")
-                
-                values_list.append(f"""
-                    ('{participant_id}', {row['rank']}, '{display_name}', 
-                     '{email}', '{username}', {str(row['is_active']).lower()}, 
-                     '{status}', {row['score']}, '{row['last_updated']}')
-                """)
-            
-            insert_sql = f"""
-            INSERT INTO {full_table_name} 
-            (participant_id, rank, display_name, email, username, is_active, status, score, last_updated)
-            VALUES {', '.join(values_list)}
-            """
-            
-            workspace_client.statement_execution.execute_statement(
-                warehouse_id=running_warehouse.id,
-                statement=insert_sql
+        # Bulk-load through a staged file; fall back to batched INSERTs where volumes
+        # are unavailable (e.g. a non-Unity Catalog catalog or missing volume privileges)
+        try:
+            load_leaderboard_from_volume(
+                workspace_client, running_warehouse.id, df, catalog_name, schema_name, table_name
             )
-            
-            logger.info(f"Inserted batch {i//batch_size + 1} with {len(batch_df)} records")
+        except Exception as e:
+            logger.warning(f"Staged load failed ({str(e)}), inserting rows in batches instead")
+            insert_leaderboard_rows(workspace_client, running_warehouse.id, df, full_table_name)
+        
+        # Drop cached counts and pages so viewers see the new contents straight away
+        invalidate_leaderboard_cache(hostname, full_table_name)
         
         logger.info(f"Successfully stored {len(df)} participants in {full_table_name}")
         
@@ -1171,6 +1268,63 @@ def store_leaderboard_in_warehouse(df, hostname, access_token, warehouse_id=None
         }
 
 
+# Rows fetched per grid page / warehouse round-trip
+LEADERBOARD_PAGE_SIZE = 100
+
+# Grid row fields, in the order fetch_leaderboard_page selects them
+LEADERBOARD_GRID_FIELDS = ("first_name", "last_name", "email", "score")
+
+# Live grid headers, shared by every render of the leaderboard
+LEADERBOARD_COLUMN_DEFS = [
+    {"headerName": "First Name", "field": "first_name", "flex": 1},
+    {"headerName": "Last Name", "field": "last_name", "flex": 1},
+    {"headerName": "Email Address", "field": "email", "flex": 1},
+    {"headerName": "Score", "field": "score", "width": 120}
+]
+
+# Grid columns that may be pushed down into the leaderboard ORDER BY
+LEADERBOARD_SORT_COLUMNS = frozenset({"first_name", "last_name", "email", "score"})
+
+# Seconds a rendered leaderboard's connection details stay on the server; longer than the
+# leaderboard warehouse's 8-hour autostop, after which the page is reloaded anyway
+LEADERBOARD_SOURCE_TTL = 12 * 60 * 60
+
+# Encrypts the token saved with each leaderboard source, so the disk cache never holds it in
+# the clear; keyed from APP_SECRET_KEY so every worker and background job can decrypt it
+LEADERBOARD_SOURCE_CIPHER = Fernet(base64.urlsafe_b64encode(hashlib.sha256(Config.APP_SECRET_KEY.encode()).digest()))
+
+
+def save_leaderboard_source(hostname, access_token, warehouse_id, full_table_name):
+    """Keep a leaderboard's connection details server-side and return the opaque id for its page.
+    
+    Only the id reaches the browser, so the token never leaves the server and the grid
+    callbacks can't be pointed at another table. The token is stored encrypted.
+    """
+    source_id = secrets.token_urlsafe(16)
+    background_cache.set(("leaderboard-source", source_id), {
+        "hostname": hostname,
+        "access_token": LEADERBOARD_SOURCE_CIPHER.encrypt(access_token.encode()),
+        "warehouse_id": warehouse_id,
+        "table": full_table_name
+    }, expire=LEADERBOARD_SOURCE_TTL)
+    return source_id
+
+
+def load_leaderboard_source(source_id):
+    """Return the connection details saved for a leaderboard page, or None if unknown or expired."""
+    if not source_id:
+        return None
+    source = background_cache.get(("leaderboard-source", source_id))
+    if not source:
+        return None
+    try:
+        access_token = LEADERBOARD_SOURCE_CIPHER.decrypt(source["access_token"]).decode()
+    except InvalidToken:
+        # Saved under a different APP_SECRET_KEY
+        return None
+    return {**source, "access_token": access_token}
+
+
 def query_leaderboard_from_warehouse(
     hostname,
     access_token,
@@ -1180,21 +1334,30 @@ def query_leaderboard_from_warehouse(
     table_name="workshop_leaderboard",
     include_refresh_controls: bool = True,
 ):
-    """Query the leaderboard from the SQL warehouse and return UI components."""
+    """Build the live leaderboard UI; rows are paged in from the SQL warehouse by the grid."""
     try:
         logger.info("Querying leaderboard from warehouse")
         
         # Create Databricks WorkspaceClient using PAT auth and normalized host
         workspace_client = create_pat_workspace_client(hostname, access_token)
         
-        # Use specified warehouse or find a running one
+        # Use specified warehouse, else the dedicated leaderboard warehouse, else any running one
+        running_warehouse = None
         if warehouse_id:
             running_warehouse = workspace_client.warehouses.get(warehouse_id)
             logger.info(f"Using specified warehouse: {running_warehouse.name}")
         else:
+            cached_warehouse_id = background_cache.get(leaderboard_warehouse_cache_key(hostname))
+            if cached_warehouse_id:
+                try:
+                    running_warehouse = workspace_client.warehouses.get(cached_warehouse_id)
+                    logger.info(f"Using leaderboard warehouse: {running_warehouse.name}")
+                except Exception as e:
+                    logger.warning(f"Leaderboard warehouse lookup failed ({str(e)}), searching for a running one")
+        
+        if not running_warehouse:
             # Find running warehouse
             warehouses = workspace_client.warehouses.list()
-            running_warehouse = None
             
             for warehouse in warehouses:
                 if warehouse.state and warehouse.state.name == "RUNNING":
@@ -1204,88 +1367,55 @@ def query_leaderboard_from_warehouse(
             if not running_warehouse:
                 raise Exception("No running warehouse found")
         
-        # Query all leaderboard rows; AG Grid will handle virtualization efficiently
-        query_sql = f"""
-        SELECT
-          element_at(split(display_name, ' '), 1) AS first_name,
-          element_at(split(display_name, ' '), -1) AS last_name,
-          email,
-          score
-        FROM {catalog_name}.{schema_name}.{table_name}
-        ORDER BY score DESC, rank ASC
-        """
-        
-        result = workspace_client.statement_execution.execute_statement(
-            warehouse_id=running_warehouse.id,
-            statement=query_sql
-        )
+        full_table_name = f"{catalog_name}.{schema_name}.{table_name}"
         
-        # Parse the results
-        leaderboard_data = []
-        if result.result and result.result.data_array:
-            for row in result.result.data_array:
-                leaderboard_data.append({
-                    'first_name': row[0],
-                    'last_name': row[1],
-                    'email': row[2],
-                    'score': row[3]
-                })
+        # Only count rows here; the grid requests each page on demand via load_leaderboard_rows
+        watermark = read_leaderboard_watermark(hostname, access_token, running_warehouse.id, full_table_name)
+        participant_count = watermark["count"]
         
-        # Build AG Grid configuration
-        column_defs = [
-            {"headerName": "First Name", "field": "first_name", "flex": 1},
-            {"headerName": "Last Name", "field": "last_name", "flex": 1},
-            {"headerName": "Email Address", "field": "email", "flex": 1},
-            {"headerName": "Score", "field": "score", "width": 120}
-        ]
-
         ag_grid = dag.AgGrid(
             id="leaderboard-ag-grid",
-            rowData=leaderboard_data,
-            columnDefs=column_defs,
+            columnDefs=LEADERBOARD_COLUMN_DEFS,
             defaultColDef={"resizable": True, "sortable": True, "filter": False},
-            rowModelType='clientSide',
+            rowModelType='infinite',
             className='ag-theme-alpine',
             dashGridOptions={
                 "pagination": True,
-                "paginationPageSize": 100,
+                "paginationPageSize": LEADERBOARD_PAGE_SIZE,
+                "cacheBlockSize": LEADERBOARD_PAGE_SIZE,
+                "maxBlocksInCache": 10,
                 "headerHeight": 48,
                 "rowHeight": 44,
-                "animateRows": True,
-                "getRowStyle": {
-                    "function": """
-                    function(params) {
-                        if (params.node.rowIndex < 3) { return {background: '#fff3cd'}; }
-                        return {};
-                    }
-                    """
-                }
+                "animateRows": True
             },
-            dangerously_allow_code=True,
+            # Highlight the podium with a CSS class (assets/leaderboard.css) instead of per-row styles
+            rowClassRules={"leaderboard-top-row": "params.node.rowIndex < 3"},
             style={"height": "650px", "width": "100%"}
         )
 
         header_controls = [
             html.Span("🔴 Live", className="badge bg-danger me-2"),
-            html.Span(f"Updated: {pd.Timestamp.now().strftime('%H:%M:%S')}", className="text-muted small"),
+            html.Span(f"Updated: {time.strftime('%H:%M:%S')}", id="leaderboard-updated-at", className="text-muted small"),
         ]
         if include_refresh_controls:
             header_controls.append(dbc.Button("🔄 Refresh Now", id="refresh-leaderboard-btn", color="outline-success", size="sm", className="ms-2"))
 
         footer_children = [
             html.P([
-                html.Span(f"📊 Loaded {len(leaderboard_data)} participants from SQL warehouse", className="text-muted small"),
+                html.Span(f"📊 {participant_count} participants in SQL warehouse", id="leaderboard-participant-count", className="text-muted small"),
                 html.Br(),
-                html.Span("⚡ AG Grid provides client-side sorting and pagination for fast interaction", className="text-info small")
+                html.Span("⚡ Pages are fetched from the warehouse on demand with LIMIT/OFFSET", className="text-info small")
             ], className="mt-2 mb-2"),
         ]
         if include_refresh_controls:
             footer_children.append(dcc.Interval(id='leaderboard-refresh-interval', interval=30*1000, n_intervals=0, disabled=False))
+            # Delta version and row count of the table as last rendered; refresh ticks compare against it
+            footer_children.append(dcc.Store(id='leaderboard-watermark', data=watermark))
 
         leaderboard_ui = html.Div([
             html.Div([
                 html.H6([
-                    html.I(className="bi bi-trophy-fill me-2", style={"color": "#ffc107"}),
+                    html.I(className="bi bi-trophy-fill me-2 trophy-icon"),
                     "Workshop Leaderboard - Live from SQL Warehouse"
                 ], className="mb-2"),
                 html.Div([
@@ -1294,10 +1424,14 @@ def query_leaderboard_from_warehouse(
                 ], className="d-flex align-items-center mb-3 flex-wrap gap-2")
             ]),
             ag_grid,
+            # Opaque id of the server-side connection details the grid callbacks query with
+            dcc.Store(id="leaderboard-source", data=save_leaderboard_source(
+                hostname, access_token, running_warehouse.id, full_table_name
+            )),
             html.Div(footer_children)
         ], id="live-leaderboard-container")
         
-        logger.info(f"Created leaderboard UI with {len(leaderboard_data)} participants")
+        logger.info(f"Created leaderboard UI for {participant_count} participants")
         return leaderboard_ui
         
     except Exception as e:
@@ -1308,38 +1442,211 @@ def query_leaderboard_from_warehouse(
         ])
 
 
-def create_simple_leaderboard_table(users_data):
+# Seconds a live leaderboard query result is shared between refresh ticks, tabs and the initial
+# render. Separate from main.py's Config.LEADERBOARD_CACHE_TTL, which is a different cache.
+LIVE_LEADERBOARD_QUERY_TTL = int(os.getenv("LIVE_LEADERBOARD_QUERY_TTL", "20"))
+
+# Locks for leaderboard queries in flight in this process, dropped once each query finishes
+leaderboard_query_locks = {}
+leaderboard_query_locks_guard = threading.Lock()
+
+
+def leaderboard_cache_tag(hostname, full_table_name):
+    """Tag grouping every cached query result for one leaderboard table."""
+    return f"leaderboard:{hostname}:{full_table_name}"
+
+
+def run_leaderboard_query(hostname, access_token, warehouse_id, full_table_name, statement, parameters=None):
+    """Run a read-only leaderboard query, reusing its rows for LIVE_LEADERBOARD_QUERY_TTL seconds.
+    
+    Results live in the shared disk cache so store_leaderboard_in_warehouse can invalidate them
+    from the background initialize process. They are keyed by a digest of the token and
+    warehouse as well, so a caller only ever gets rows its own credentials already fetched.
+    Concurrent misses for the same statement in this process wait on one query instead of
+    each hitting the warehouse. `parameters` maps named :markers in the statement to integer
+    values.
+    """
+    tag = leaderboard_cache_tag(hostname, full_table_name)
+    credentials = hashlib.sha256(f"{warehouse_id}:{access_token}".encode()).hexdigest()
+    cache_key = (tag, credentials, statement, tuple(sorted((parameters or {}).items())))
+    rows = background_cache.get(cache_key)
+    if rows is not None:
+        return rows
+    
+    with leaderboard_query_locks_guard:
+        lock = leaderboard_query_locks.setdefault(cache_key, threading.Lock())
+    try:
+        with lock:
+            rows = background_cache.get(cache_key)
+            if rows is not None:
+                return rows
+            
+            from databricks.sdk.service.sql import StatementParameterListItem
+            
+            workspace_client = create_pat_workspace_client(hostname, access_token)
+            result = workspace_client.statement_execution.execute_statement(
+                warehouse_id=warehouse_id,
+                statement=statement,
+                parameters=[
+                    StatementParameterListItem(name=name, value=str(value), type="INT")
+                    for name, value in (parameters or {}).items()
+                ] or None,
+                wait_timeout="50s"
+            )
+            # A statement still pending on a cold warehouse, or one that failed, has no rows;
+            # raise rather than cache an empty result for everyone
+            require_statement_succeeded(result, "Leaderboard query")
+            rows = (result.result.data_array if result.result else None) or []
+            background_cache.set(cache_key, rows, expire=LIVE_LEADERBOARD_QUERY_TTL, tag=tag)
+            return rows
+    finally:
+        # Waiters already hold the lock object and later callers hit the cache, so the
+        # entry can go as soon as the query is done
+        with leaderboard_query_locks_guard:
+            if leaderboard_query_locks.get(cache_key) is lock:
+                del leaderboard_query_locks[cache_key]
+
+
+def invalidate_leaderboard_cache(hostname, full_table_name):
+    """Drop every cached count and page of one leaderboard table."""
+    background_cache.evict(leaderboard_cache_tag(hostname, full_table_name))
+
+
+def read_leaderboard_version(hostname, access_token, warehouse_id, full_table_name):
+    """Return the leaderboard table's current Delta version.
+    
+    Every write commits a new version, including a facilitator's
+    `UPDATE ... SET score = score + 10`, which leaves the row count and last_updated alone.
+    """
+    rows = run_leaderboard_query(
+        hostname, access_token, warehouse_id, full_table_name,
+        f"DESCRIBE HISTORY {full_table_name} LIMIT 1"
+    )
+    return int(rows[0][0]) if rows else None
+
+
+def read_leaderboard_watermark(hostname, access_token, warehouse_id, full_table_name):
+    """Return the leaderboard table's Delta version and row count."""
+    rows = run_leaderboard_query(
+        hostname, access_token, warehouse_id, full_table_name,
+        f"SELECT COUNT(*) FROM {full_table_name}"
+    )
+    return {
+        "version": read_leaderboard_version(hostname, access_token, warehouse_id, full_table_name),
+        "count": int(rows[0][0]) if rows else 0
+    }
+
+
+@functools.lru_cache(maxsize=32)
+def build_leaderboard_page_sql(full_table_name, order_by):
+    """Build the page query for one table and sort order, with :limit/:offset left as markers.
+    
+    Paging through the grid then reuses the same statement text, so the warehouse can reuse
+    its plan and only the bound values change.
+    """
+    return f"""
+    SELECT
+      element_at(split(display_name, ' '), 1) AS first_name,
+      element_at(split(display_name, ' '), -1) AS last_name,
+      email,
+      score
+    FROM {full_table_name}
+    ORDER BY {', '.join(order_by)}
+    LIMIT :limit OFFSET :offset
+    """
+
+
+def fetch_leaderboard_page(hostname, access_token, warehouse_id, full_table_name, start_row, end_row, sort_model=None):
+    """Fetch one page of leaderboard rows from the SQL warehouse."""
+    # Honour grid sorting on known columns only, then fall back to the leaderboard order
+    order_by = [
+        f"{sort['colId']} {'DESC' if sort.get('sort') == 'desc' else 'ASC'}"
+        for sort in (sort_model or [])
+        if sort.get('colId') in LEADERBOARD_SORT_COLUMNS
+    ]
+    order_by += ["score DESC", "rank ASC"]
+    
+    rows = run_leaderboard_query(
+        hostname, access_token, warehouse_id, full_table_name,
+        build_leaderboard_page_sql(full_table_name, tuple(order_by)),
+        {"limit": int(end_row) - int(start_row), "offset": int(start_row)}
+    )
+    
+    # One pass from result tuples straight to the grid's row dicts
+    return [dict(zip(LEADERBOARD_GRID_FIELDS, row)) for row in rows]
+
+
+@app.callback(
+    Output("leaderboard-ag-grid", "getRowsResponse"),
+    Input("leaderboard-ag-grid", "getRowsRequest"),
+    State("leaderboard-source", "data"),
+    prevent_initial_call=True
+)
+def load_leaderboard_rows(request, source_id):
+    """Serve the block of rows the infinite-model grid asked for."""
+    if not request:
+        return dash.no_update
+    
+    start_row = request.get("startRow", 0)
+    end_row = request.get("endRow", start_row + LEADERBOARD_PAGE_SIZE)
+    source = load_leaderboard_source(source_id)
+    if not source:
+        logger.warning("Leaderboard source expired or unknown; reload the page to reconnect")
+        return {"rowData": [], "rowCount": start_row}
+    try:
+        rows = fetch_leaderboard_page(
+            source["hostname"], source["access_token"], source["warehouse_id"], source["table"],
+            start_row, end_row, request.get("sortModel")
+        )
+    except Exception as e:
+        logger.error(f"Error fetching leaderboard rows {start_row}-{end_row}: {str(e)}")
+        return {"rowData": [], "rowCount": start_row}
+    
+    # A short page means we reached the end, which tells the grid the total row count
+    row_count = start_row + len(rows) if len(rows) < end_row - start_row else None
+    return {"rowData": rows, "rowCount": row_count}
+
+
+# Fallback table headers
+SIMPLE_LEADERBOARD_COLUMNS = [
+    {"name": column, "id": column} for column in ("Rank", "Name", "Email", "Status", "Score")
+]
+
+
+def create_simple_leaderboard_table(participants_df):
     """Create a simple fallback leaderboard table for in-memory display."""
-    table_rows = []
-    for i, user in enumerate(users_data):
-        table_rows.append(html.Tr([
-            html.Td(f"#{i+1}"),
-            html.Td(user['Display Name']),
-            html.Td(user['Email']),
-            html.Td("✅ Active" if user['Status'] == '✅ Active' else "❌ Inactive"),
-            html.Td("0 pts")
-        ]))
+    participant_count = len(participants_df)
+    table_data = pd.DataFrame({
+        "Rank": [f"#{rank}" for rank in range(1, participant_count + 1)],
+        "Name": participants_df['display_name'].to_numpy(),
+        "Email": participants_df['email'].to_numpy(),
+        "Status": np.where(participants_df['is_active'].to_numpy(), "✅ Active", "❌ Inactive"),
+        "Score": "0 pts"
+    }).to_dict('records')
     
     return html.Div([
         html.H6([
-            html.I(className="bi bi-trophy-fill me-2", style={"color": "#ffc107"}),
+            html.I(className="bi bi-trophy-fill me-2 trophy-icon"),
             f"Workshop Leaderboard - Memory Mode"
         ], className="mb-3"),
         
-        dbc.Table([
-            html.Thead([
-                html.Tr([
-                    html.Th("Rank"),
-                    html.Th("Name"),
-                    html.Th("Email"),
-                    html.Th("Status"),
-                    html.Th("Score")
-                ])
-            ]),
-            html.Tbody(table_rows)
-        ], bordered=True, striped=True, hover=True),
+        # Rendered client-side from one records list instead of a component per cell
+        dash_table.DataTable(
+            data=table_data,
+            columns=SIMPLE_LEADERBOARD_COLUMNS,
+            virtualization=True,
+            page_action='none',
+            fixed_rows={'headers': True},
+            style_table={'maxHeight': '600px', 'overflowY': 'auto'},
+            style_cell={'textAlign': 'left'},
+            # Column-level styles are sent once for the whole table, not per row
+            style_cell_conditional=[
+                {'if': {'column_id': 'Rank'}, 'fontWeight': 'bold'},
+                {'if': {'column_id': 'Score'}, 'fontWeight': 'bold', 'color': '#198754'}
+            ]
+        ),
         
-        html.P(f"Showing {len(users_data)} participants (fallback mode)", 
+        html.P(f"Showing {participant_count} participants (fallback mode)", 
                className="text-muted small mt-2")
     ])
 
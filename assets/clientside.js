@@ -0,0 +1,53 @@
+// Clientside callbacks: UI-only feedback that should not wait on a server round-trip.
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    ui: {
+        // Re-request the live grid's loaded blocks so changed scores update in place,
+        // instead of re-rendering the whole leaderboard component tree.
+        refreshLeaderboardGrid: function(watermark) {
+            dash_ag_grid.getApiAsync("leaderboard-ag-grid").then(function(api) {
+                api.refreshInfiniteCache();
+            });
+        },
+        // Pause the auto-refresh interval on every page except the leaderboard, so idle
+        // tabs don't fire refresh callbacks.
+        autoRefreshDisabled: function(appState) {
+            return !appState || appState.page !== "leaderboard";
+        }
+    },
+    leaderboard: {
+        // Build the demo leaderboard cards from plain rows, so the server sends row data
+        // instead of a serialized component tree on every refresh.
+        renderCards: function(data) {
+            function el(type, className, children) {
+                var props = {children: children};
+                if (className) {
+                    props.className = className;
+                }
+                return {type: type, namespace: "dash_html_components", props: props};
+            }
+            if (!data) {
+                return [];
+            }
+            if (data.message) {
+                return [el("P", "text-center", data.message)];
+            }
+            if (!data.rows.length) {
+                return [el("P", "text-center", "No scores yet. Be the first to answer questions!")];
+            }
+            var medals = ["🥇", "🥈", "🥉"];
+            return data.rows.map(function(row, i) {
+                var medal = medals[i] || "#" + (i + 1);
+                return el("Div", "card card-body mb-2 d-flex flex-row justify-content-between align-items-center", [
+                    el("Div", null, [
+                        el("H5", "mb-1", medal + " " + row.display_name),
+                        el("P", "text-muted mb-0", row.email)
+                    ]),
+                    el("Div", "text-end", [
+                        el("H4", "text-primary mb-0", String(row.total_points)),
+                        el("P", "text-muted mb-0", row.questions_answered + " questions")
+                    ])
+                ]);
+            });
+        }
+    }
+});
@@ -1,5 +1,6 @@
 """Configuration module for the Delta Scoreboard application."""
 
+import functools
 import os
 from dotenv import load_dotenv
 
@@ -25,23 +26,43 @@ class Config:
     USERS_TABLE = os.getenv('USERS_TABLE', 'eligible_users')
     RESPONSES_TABLE = os.getenv('RESPONSES_TABLE', 'user_responses')
     LEADERBOARD_TABLE = os.getenv('LEADERBOARD_TABLE', 'leaderboard')
+    DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', '25'))
     
     # Workshop Configuration
     MAX_QUESTIONS = int(os.getenv('MAX_QUESTIONS', '10'))
     POINTS_PER_QUESTION = int(os.getenv('POINTS_PER_QUESTION', '10'))
     
+    # Seconds a SCIM workspace user listing is reused before it is fetched again
+    USER_CACHE_TTL = int(os.getenv('USER_CACHE_TTL', '300'))
+    
+    # Seconds the eligible email set is reused for login checks
+    ELIGIBILITY_CACHE_TTL = int(os.getenv('ELIGIBILITY_CACHE_TTL', '60'))
+    
+    # Seconds a leaderboard query result is reused between refreshes
+    LEADERBOARD_CACHE_TTL = int(os.getenv('LEADERBOARD_CACHE_TTL', '5'))
+    
+    # Prefix of the template values shown in the credential form and .env examples
+    PLACEHOLDER_PREFIX = 'your-'
+    
     @classmethod
     def validate_config(cls) -> bool:
         """Validate that required configuration values are set."""
         # For runtime credentials, this is no longer required
         return True
     
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def normalize_answer(answer: str) -> str:
+        """Normalize an answer for comparison; the few distinct answer strings are cached."""
+        return answer.strip().lower()
+    
     @classmethod
     def validate_runtime_credentials(cls, hostname: str, http_path: str, access_token: str, workspace_id: str = None) -> bool:
         """Validate runtime credentials."""
-        if not hostname or not http_path or not access_token:
+        credentials = (hostname, http_path, access_token)
+        if not all(credentials):
             return False
-        if hostname.startswith('your-') or http_path.startswith('your-') or access_token.startswith('your-'):
+        if any(value.startswith(cls.PLACEHOLDER_PREFIX) for value in credentials):
             return False
         # Workspace ID is optional but if provided, should be numeric
         if workspace_id and not workspace_id.isdigit():
@@ -2,14 +2,87 @@
 
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from databricks import sql
 from databricks.sdk import WorkspaceClient
 from typing import List, Dict, Optional, Any
+import atexit
+import functools
 import logging
+import queue
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from contextlib import contextmanager
 from config import Config
 
 logger = logging.getLogger(__name__)
 
+# Users requested per SCIM page
+SCIM_PAGE_SIZE = 1000
+
+# SCIM pages fetched at once after the first; stays within the REST session's connection pool
+SCIM_MAX_CONCURRENT_PAGES = 4
+
+# Upper bound on bound parameters per statement when batching rows into one query
+MAX_QUERY_PARAMETERS = 256
+
+# Users table columns written by sync_users_to_table, and the SCIM user keys they come from
+USERS_SYNC_COLUMNS = ("user_id", "email", "display_name", "user_name")
+USERS_SYNC_KEYS = ("id", "email", "display_name", "user_name")
+USERS_MERGE_BATCH_SIZE = MAX_QUERY_PARAMETERS // len(USERS_SYNC_COLUMNS)
+
+# Responses table columns written per submitted answer
+RESPONSE_COLUMNS = ("response_id", "user_id", "question_id", "user_answer", "correct_answer", "points_earned")
+RESPONSES_INSERT_BATCH_SIZE = MAX_QUERY_PARAMETERS // len(RESPONSE_COLUMNS)
+
+# Submitted responses waiting for the background writer
+RESPONSES_QUEUE_SIZE = 10000
+# Longest a submitting request waits for the writer before reporting failure
+RESPONSES_SUBMIT_TIMEOUT = 30
+
+# Queued by ResponseManager.close to stop the writer once everything before it is written
+_STOP_WRITER = object()
+
+
+@functools.lru_cache(maxsize=32)
+def build_values_rows(row_count: int, column_count: int) -> str:
+    """Build the rows of a VALUES list as named markers, :p{row}_{column}."""
+    return ", ".join(
+        "(" + ", ".join(f":p{row}_{column}" for column in range(column_count)) + ")"
+        for row in range(row_count)
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def build_users_merge_sql(row_count: int) -> str:
+    """Build the users MERGE for a batch of row_count users.
+    
+    Every full batch shares the same statement text, so it is formatted once and only the
+    bound values change between batches.
+    """
+    return f"""
+    MERGE INTO {Config.USERS_TABLE} AS target
+    USING (VALUES {build_values_rows(row_count, len(USERS_SYNC_COLUMNS))}) AS source({', '.join(USERS_SYNC_COLUMNS)})
+    ON target.user_id = source.user_id
+    WHEN NOT MATCHED THEN
+        INSERT (user_id, email, display_name, user_name)
+        VALUES (source.user_id, source.email, source.display_name, source.user_name)
+    WHEN MATCHED THEN
+        UPDATE SET email = source.email, display_name = source.display_name, user_name = source.user_name
+    """
+
+
+def bind_values_rows(rows: List[tuple]) -> Dict[str, Any]:
+    """Bind row tuples to the markers produced by build_values_rows."""
+    return {
+        f"p{row}_{column}": value
+        for row, values in enumerate(rows)
+        for column, value in enumerate(values)
+    }
+
 class DatabricksConnection:
     """Handles connection to Databricks SQL warehouse."""
     
@@ -17,12 +90,40 @@ class DatabricksConnection:
         self.connection = None
         self.workspace_client = None
         
+        # Idle cursors, one per SQL connection, opened on demand up to Config.DB_POOL_SIZE
+        # so concurrent callbacks each query on their own connection instead of sharing one;
+        # a connection keeps its cursor across queries rather than creating one per query
+        self._idle_cursors = queue.LifoQueue()
+        self._pool_slots = threading.BoundedSemaphore(Config.DB_POOL_SIZE)
+        self._open_connections = []
+        self._open_connections_lock = threading.Lock()
+        
+        # One keep-alive HTTP session for REST calls (SCIM pages, warehouse creation), so
+        # the TLS handshake is paid once; idempotent GETs retry on transient failures
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=(429, 502, 503, 504))
+        ))
+        
         # Use provided credentials or fall back to config
         self.hostname = hostname or Config.DATABRICKS_SERVER_HOSTNAME
         self.workspace_id = workspace_id
         self.http_path = http_path or Config.DATABRICKS_HTTP_PATH
         self.access_token = access_token or Config.DATABRICKS_ACCESS_TOKEN
         
+        # REST endpoint and headers only depend on the credentials, so build them once
+        self._scim_base_url = f"https://{self.hostname}/api/2.0/preview/scim/v2"
+        self._scim_headers = {
+            'Authorization': f'Bearer {self.access_token}',
+            'Content-Type': 'application/scim+json'
+        }
+        self._rest_headers = {
+            "Authorization": f"Bearer {self.access_token}",
+            "Content-Type": "application/json"
+        }
+        
     def connect(self) -> bool:
         """Establish connection to Databricks SQL warehouse."""
         try:
@@ -30,11 +131,9 @@ class DatabricksConnection:
                 logger.error("Missing required Databricks credentials")
                 return False
                 
-            self.connection = sql.connect(
-                server_hostname=self.hostname,
-                http_path=self.http_path,
-                access_token=self.access_token
-            )
+            # Open the first pooled connection now so bad credentials fail here
+            self.connection = self._open_connection()
+            self._idle_cursors.put(self.connection.cursor())
             
             # Also create workspace client for user management
             self.workspace_client = WorkspaceClient(
@@ -49,40 +148,82 @@ class DatabricksConnection:
             logger.error(f"Failed to connect to Databricks: {str(e)}")
             return False
     
+    def _open_connection(self):
+        """Open a new SQL warehouse connection and track it for close()."""
+        connection = sql.connect(
+            server_hostname=self.hostname,
+            http_path=self.http_path,
+            access_token=self.access_token,
+            # Large results download as Arrow batches from cloud storage instead of over Thrift
+            use_cloud_fetch=True
+        )
+        with self._open_connections_lock:
+            self._open_connections.append(connection)
+        return connection
+    
+    @contextmanager
+    def _borrow_cursor(self):
+        """Lend an idle pooled cursor, opening a connection if none is idle and the pool isn't full."""
+        with self._pool_slots:
+            try:
+                cursor = self._idle_cursors.get_nowait()
+            except queue.Empty:
+                cursor = self._open_connection().cursor()
+            try:
+                yield cursor
+            except Exception:
+                # Don't hand a cursor in an unknown state to the next query
+                cursor = self._replace_cursor(cursor)
+                raise
+            finally:
+                self._idle_cursors.put(cursor)
+    
+    def _replace_cursor(self, cursor):
+        """Return a fresh cursor for a failed one, reconnecting if its connection has dropped."""
+        try:
+            connection = cursor.connection
+            cursor.close()
+            return connection.cursor()
+        except Exception:
+            logger.warning("Pooled connection is no longer usable, reconnecting")
+            return self._open_connection().cursor()
+    
     def execute_query(self, query: str, params: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
         """Execute a SQL query and return results as DataFrame."""
         if not self.connection:
             raise Exception("Not connected to Databricks")
         
         try:
-            cursor = self.connection.cursor()
-            cursor.execute(query, params or {})
-            
-            # Fetch results and column names
-            results = cursor.fetchall()
-            columns = [desc[0] for desc in cursor.description]
-            
-            return pd.DataFrame(results, columns=columns)
+            with self._borrow_cursor() as cursor:
+                # Executing releases the cursor's previous result set
+                cursor.execute(query, params or {})
+                
+                # Stream rows from the cursor straight into the DataFrame rather than
+                # holding a fetchall() list alongside it
+                columns = [desc[0] for desc in cursor.description]
+                return pd.DataFrame.from_records(iter(cursor), columns=columns)
             
         except Exception as e:
             logger.error(f"Error executing query: {str(e)}")
             raise
     
     def close(self):
-        """Close the connection."""
-        if self.connection:
-            self.connection.close()
+        """Close every pooled connection, with its cursor, and the REST session."""
+        with self._open_connections_lock:
+            connections, self._open_connections = self._open_connections, []
+        for connection in connections:
+            connection.close()
+        self._idle_cursors = queue.LifoQueue()
+        self.connection = None
+        self.session.close()
     
     def get_scim_headers(self) -> Dict[str, str]:
         """Get headers for SCIM API requests."""
-        return {
-            'Authorization': f'Bearer {self.access_token}',
-            'Content-Type': 'application/scim+json'
-        }
+        return self._scim_headers
     
     def get_scim_base_url(self) -> str:
         """Get base URL for SCIM API requests."""
-        return f"https://{self.hostname}/api/2.0/preview/scim/v2"
+        return self._scim_base_url
     
     def create_sql_warehouse(self, name: str, cluster_size: str, auto_stop_mins: int = 45, 
                            max_num_clusters: int = 1, warehouse_type: str = "PRO") -> Dict[str, Any]:
@@ -102,12 +243,7 @@ class DatabricksConnection:
                 }
             }
             
-            headers = {
-                "Authorization": f"Bearer {self.access_token}",
-                "Content-Type": "application/json"
-            }
-            
-            response = requests.post(url, json=payload, headers=headers)
+            response = self.session.post(url, json=payload, headers=self._rest_headers)
             response.raise_for_status()
             
             warehouse_data = response.json()
@@ -133,39 +269,71 @@ class UserManager:
     
     def __init__(self, db_connection: DatabricksConnection):
         self.db = db_connection
+        self._users_cache = None
+        self._users_cached_at = 0.0
+        self._eligible_emails = None
+        self._eligible_emails_loaded_at = 0.0
+    
+    def invalidate_users(self):
+        """Drop the cached workspace users and eligible emails so the next lookups re-read them."""
+        self._users_cache = None
+        self._eligible_emails = None
+    
+    def _fetch_users_page(self, start_index: int) -> Dict[str, Any]:
+        """Fetch one page of workspace users from the SCIM API."""
+        response = self.db.session.get(
+            f"{self.db.get_scim_base_url()}/Users",
+            headers=self.db.get_scim_headers(),
+            params={'count': SCIM_PAGE_SIZE, 'startIndex': start_index}
+        )
+        response.raise_for_status()
+        return response.json()
     
     def get_workspace_users(self) -> List[Dict[str, str]]:
-        """Get all users eligible to work in the workspace using SCIM API."""
+        """Get all users eligible to work in the workspace using SCIM API.
+        
+        The list is cached for Config.USER_CACHE_TTL seconds.
+        """
+        if self._users_cache is not None and time.monotonic() - self._users_cached_at < Config.USER_CACHE_TTL:
+            return self._users_cache
+        
         try:
             if not self.db.access_token or not self.db.hostname:
                 raise Exception("Missing credentials for SCIM API")
             
-            # Use SCIM API to get users
-            scim_url = f"{self.db.get_scim_base_url()}/Users"
-            headers = self.db.get_scim_headers()
+            # The first page reports the directory size and the server's page size; the
+            # remaining pages are independent, so fetch them concurrently
+            first_page = self._fetch_users_page(1)
+            resources = first_page.get('Resources', [])
+            page_size = len(resources)
+            total_results = first_page.get('totalResults', 0)
             
-            response = requests.get(scim_url, headers=headers, params={'count': 100})
-            response.raise_for_status()
+            pages = [resources]
+            if page_size:
+                start_indexes = range(1 + page_size, total_results + 1, page_size)
+                with ThreadPoolExecutor(max_workers=SCIM_MAX_CONCURRENT_PAGES) as executor:
+                    pages.extend(page.get('Resources', []) for page in executor.map(self._fetch_users_page, start_indexes))
             
-            data = response.json()
             users = []
-            
-            for user in data.get('Resources', []):
-                if user.get('active', False):
-                    # Extract email from emails array
-                    email = None
-                    emails = user.get('emails', [])
-                    if emails:
-                        email = emails[0].get('value')
-                    
-                    users.append({
-                        'id': user.get('id'),
-                        'email': email,
-                        'display_name': user.get('displayName'),
-                        'user_name': user.get('userName')
-                    })
+            for resources in pages:
+                for user in resources:
+                    if user.get('active', False):
+                        # Extract email from emails array
+                        email = None
+                        emails = user.get('emails', [])
+                        if emails:
+                            email = emails[0].get('value')
+                        
+                        users.append({
+                            'id': user.get('id'),
+                            'email': email,
+                            'display_name': user.get('displayName'),
+                            'user_name': user.get('userName')
+                        })
             
             logger.info(f"Retrieved {len(users)} users from SCIM API")
+            self._users_cache = users
+            self._users_cached_at = time.monotonic()
             return users
             
         except Exception as e:
@@ -202,23 +370,21 @@ class UserManager:
     def sync_users_to_table(self) -> bool:
         """Sync workspace users to the database table."""
         try:
+            # Always sync from a fresh directory listing
+            self.invalidate_users()
             users = self.get_workspace_users()
             
-            for user in users:
-                query = f"""
-                MERGE INTO {Config.USERS_TABLE} AS target
-                USING (SELECT '{user['id']}' as user_id, '{user['email']}' as email, 
-                       '{user['display_name']}' as display_name, '{user['user_name']}' as user_name) AS source
-                ON target.user_id = source.user_id
-                WHEN NOT MATCHED THEN
-                    INSERT (user_id, email, display_name, user_name)
-                    VALUES (source.user_id, source.email, source.display_name, source.user_name)
-                WHEN MATCHED THEN
-                    UPDATE SET email = source.email, display_name = source.display_name, user_name = source.user_name
-                """
+            # One MERGE per batch of users instead of one per user; values are bound as
+            # named parameters, so names with quotes can't break the statement
+            for start in range(0, len(users), USERS_MERGE_BATCH_SIZE):
+                batch = users[start:start + USERS_MERGE_BATCH_SIZE]
+                params = bind_values_rows([tuple(user[key] for key in USERS_SYNC_KEYS) for user in batch])
+                query = build_users_merge_sql(len(batch))
                 
-                self.db.execute_query(query)
+                self.db.execute_query(query, params)
             
+            # Eligibility checks must see the users just merged
+            self._eligible_emails = None
             logger.info(f"Synced {len(users)} users to database")
             return True
             
@@ -226,12 +392,19 @@ class UserManager:
             logger.error(f"Error syncing users to table: {str(e)}")
             return False
     
+    def _load_eligible_emails(self) -> frozenset:
+        """Return the users table's emails, reloading them every Config.ELIGIBILITY_CACHE_TTL seconds."""
+        if self._eligible_emails is None or time.monotonic() - self._eligible_emails_loaded_at >= Config.ELIGIBILITY_CACHE_TTL:
+            result = self.db.execute_query(f"SELECT email FROM {Config.USERS_TABLE}")
+            self._eligible_emails = frozenset(result['email'].dropna())
+            self._eligible_emails_loaded_at = time.monotonic()
+        return self._eligible_emails
+    
     def is_user_eligible(self, email: str) -> bool:
         """Check if a user is eligible to participate."""
         try:
-            query = f"SELECT COUNT(*) as count FROM {Config.USERS_TABLE} WHERE email = '{email}'"
-            result = self.db.execute_query(query)
-            return result.iloc[0]['count'] > 0
+            # One in-process set lookup instead of a warehouse round-trip per check
+            return email in self._load_eligible_emails()
             
         except Exception as e:
             logger.error(f"Error checking user eligibility: {str(e)}")
@@ -242,6 +415,16 @@ class ResponseManager:
     
     def __init__(self, db_connection: DatabricksConnection):
         self.db = db_connection
+        self._leaderboard_cache = None
+        self._leaderboard_cached_at = 0.0
+        # Only one caller refreshes an expired leaderboard; the rest wait and reuse its result
+        self._leaderboard_lock = threading.Lock()
+        
+        # Submissions are queued and written in batches by one background thread, so answers
+        # arriving together share one warehouse INSERT; each submitter waits for its batch
+        self._pending_responses = queue.Queue(maxsize=RESPONSES_QUEUE_SIZE)
+        self._writer = None
+        self._writer_lock = threading.Lock()
     
     def create_responses_table(self) -> bool:
         """Create the user responses table if it doesn't exist."""
@@ -267,23 +450,99 @@ class ResponseManager:
             logger.error(f"Error creating responses table: {str(e)}")
             return False
     
-    def submit_response(self, user_id: str, question_id: int, user_answer: str, correct_answer: str) -> bool:
-        """Submit a user's response to a question."""
-        try:
-            import uuid
-            response_id = str(uuid.uuid4())
-            points = Config.POINTS_PER_QUESTION if user_answer.strip().lower() == correct_answer.strip().lower() else 0
-            
+    @staticmethod
+    def _response_row(user_id: str, question_id: int, user_answer: str, correct_answer: str) -> tuple:
+        """Build one responses table row, in RESPONSE_COLUMNS order, for a submitted answer."""
+        points = Config.POINTS_PER_QUESTION if Config.normalize_answer(user_answer) == Config.normalize_answer(correct_answer) else 0
+        return (str(uuid.uuid4()), user_id, question_id, user_answer, correct_answer, points)
+    
+    def _insert_responses(self, rows: List[tuple]):
+        """Insert response rows with one parameterized multi-row INSERT per batch."""
+        for start in range(0, len(rows), RESPONSES_INSERT_BATCH_SIZE):
+            batch = rows[start:start + RESPONSES_INSERT_BATCH_SIZE]
             query = f"""
             INSERT INTO {Config.RESPONSES_TABLE} 
-            (response_id, user_id, question_id, user_answer, correct_answer, points_earned)
-            VALUES ('{response_id}', '{user_id}', {question_id}, '{user_answer}', '{correct_answer}', {points})
+            ({', '.join(RESPONSE_COLUMNS)})
+            VALUES {build_values_rows(len(batch), len(RESPONSE_COLUMNS))}
             """
-            
-            self.db.execute_query(query)
+            self.db.execute_query(query, bind_values_rows(batch))
+        
+        # New scores change the standings, so don't serve the cached leaderboard
+        self._leaderboard_cache = None
+    
+    def _queue_response(self, row: tuple) -> Future:
+        """Queue a response row for the background writer, starting it on first use."""
+        result = Future()
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_pending_responses, name="response-writer", daemon=True)
+                self._writer.start()
+                # Write anything still queued before the interpreter exits
+                atexit.register(self.close)
+            self._pending_responses.put_nowait((row, result))
+        return result
+    
+    def close(self):
+        """Write every queued response, then stop the background writer."""
+        with self._writer_lock:
+            writer, self._writer = self._writer, None
+            if writer is None:
+                return
+            atexit.unregister(self.close)
+            # The stop marker queues behind pending responses, so they are all written first
+            self._pending_responses.put(_STOP_WRITER)
+        writer.join()
+    
+    def _write_pending_responses(self):
+        """Drain queued responses, inserting everything that arrived during the previous INSERT together."""
+        stopping = False
+        while not stopping:
+            item = self._pending_responses.get()
+            if item is _STOP_WRITER:
+                return
+            batch = [item]
+            while len(batch) < RESPONSES_INSERT_BATCH_SIZE:
+                try:
+                    item = self._pending_responses.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP_WRITER:
+                    stopping = True
+                    break
+                batch.append(item)
+            
+            rows = [row for row, _ in batch]
+            try:
+                self._insert_responses(rows)
+                logger.info(f"Wrote {len(rows)} queued responses")
+                written = True
+            except Exception as e:
+                logger.error(f"Error writing {len(rows)} queued responses: {str(e)}")
+                written = False
+            for _, result in batch:
+                result.set_result(written)
+    
+    def submit_response(self, user_id: str, question_id: int, user_answer: str, correct_answer: str) -> bool:
+        """Submit a user's response to a question.
+        
+        The response is written by the background writer together with any others submitted
+        at the same moment; this returns once that INSERT has run, with whether it succeeded,
+        or False if it has not finished within RESPONSES_SUBMIT_TIMEOUT seconds.
+        """
+        try:
+            result = self._queue_response(self._response_row(user_id, question_id, user_answer, correct_answer))
+            if not result.result(timeout=RESPONSES_SUBMIT_TIMEOUT):
+                return False
             logger.info(f"Response submitted for user {user_id}, question {question_id}")
             return True
             
+        except queue.Full:
+            logger.error(f"Response queue full, dropping response for user {user_id}, question {question_id}")
+            return False
+        except FutureTimeoutError:
+            # The row stays queued and may still be written; the caller just stops waiting for it
+            logger.error(f"Timed out waiting to write response for user {user_id}, question {question_id}")
+            return False
         except Exception as e:
             logger.error(f"Error submitting response: {str(e)}")
             return False
@@ -291,30 +550,52 @@ class ResponseManager:
     def get_user_score(self, user_id: str) -> int:
         """Get the total score for a user."""
         try:
-            query = f"SELECT SUM(points_earned) as total_points FROM {Config.RESPONSES_TABLE} WHERE user_id = '{user_id}'"
-            result = self.db.execute_query(query)
+            query = f"SELECT SUM(points_earned) as total_points FROM {Config.RESPONSES_TABLE} WHERE user_id = :user_id"
+            result = self.db.execute_query(query, {'user_id': user_id})
             return result.iloc[0]['total_points'] or 0
             
         except Exception as e:
             logger.error(f"Error getting user score: {str(e)}")
             return 0
     
+    def _cached_leaderboard(self) -> Optional[pd.DataFrame]:
+        """Return the cached leaderboard if it is still fresh, else None."""
+        leaderboard = self._leaderboard_cache
+        if leaderboard is not None and time.monotonic() - self._leaderboard_cached_at < Config.LEADERBOARD_CACHE_TTL:
+            return leaderboard
+        return None
+    
     def get_leaderboard(self) -> pd.DataFrame:
-        """Get the current leaderboard."""
+        """Get the current leaderboard.
+        
+        Reused for Config.LEADERBOARD_CACHE_TTL seconds, or until a response is submitted.
+        """
+        leaderboard = self._cached_leaderboard()
+        if leaderboard is not None:
+            return leaderboard
+        
         try:
-            query = f"""
-            SELECT 
-                u.display_name,
-                u.email,
-                COALESCE(SUM(r.points_earned), 0) as total_points,
-                COUNT(r.response_id) as questions_answered
-            FROM {Config.USERS_TABLE} u
-            LEFT JOIN {Config.RESPONSES_TABLE} r ON u.user_id = r.user_id
-            GROUP BY u.user_id, u.display_name, u.email
-            ORDER BY total_points DESC, questions_answered DESC
-            """
-            
-            return self.db.execute_query(query)
+            with self._leaderboard_lock:
+                # Another caller may have refreshed it while this one waited
+                leaderboard = self._cached_leaderboard()
+                if leaderboard is not None:
+                    return leaderboard
+                
+                query = f"""
+                SELECT 
+                    u.display_name,
+                    u.email,
+                    COALESCE(SUM(r.points_earned), 0) as total_points,
+                    COUNT(r.response_id) as questions_answered
+                FROM {Config.USERS_TABLE} u
+                LEFT JOIN {Config.RESPONSES_TABLE} r ON u.user_id = r.user_id
+                GROUP BY u.user_id, u.display_name, u.email
+                ORDER BY total_points DESC, questions_answered DESC
+                """
+                
+                self._leaderboard_cache = self.db.execute_query(query)
+                self._leaderboard_cached_at = time.monotonic()
+                return self._leaderboard_cache
             
         except Exception as e:
             logger.error(f"Error getting leaderboard: {str(e)}")
@@ -2,11 +2,16 @@
 
 import pandas as pd
 import uuid
+from collections import Counter
 from typing import List, Dict, Optional
 import logging
+from config import Config
 
 logger = logging.getLogger(__name__)
 
+# Columns of a mock response; responses are stored column-wise, one list per column
+MOCK_RESPONSE_COLUMNS = ('response_id', 'user_id', 'question_id', 'user_answer', 'correct_answer', 'points_earned', 'submitted_at')
+
 class MockDatabricksConnection:
     """Mock Databricks connection for demo purposes."""
     
@@ -18,7 +23,7 @@ class MockDatabricksConnection:
                 {'user_id': '2', 'email': 'test@example.com', 'display_name': 'Test User', 'user_name': 'test'},
                 {'user_id': '3', 'email': 'admin@example.com', 'display_name': 'Admin User', 'user_name': 'admin'}
             ],
-            'responses': []
+            'responses': {column: [] for column in MOCK_RESPONSE_COLUMNS}
         }
     
     def connect(self) -> bool:
@@ -50,6 +55,7 @@ class MockUserManager:
     def __init__(self, db_connection):
         self.db = db_connection
         self.users = db_connection.mock_data['users']
+        self._emails = {user['email'] for user in self.users}
     
     def get_workspace_users(self) -> List[Dict[str, str]]:
         """Return mock users."""
@@ -67,7 +73,7 @@ class MockUserManager:
     
     def is_user_eligible(self, email: str) -> bool:
         """Check if user is eligible (mock)."""
-        return any(user['email'] == email for user in self.users)
+        return email in self._emails
 
 class MockResponseManager:
     """Mock response manager for demo purposes."""
@@ -75,6 +81,17 @@ class MockResponseManager:
     def __init__(self, db_connection):
         self.db = db_connection
         self.responses = db_connection.mock_data['responses']
+        
+        # Running per-user totals, kept in step with self.responses by submit_response
+        self._scores = Counter()
+        self._questions_answered = Counter()
+        for user_id, points in zip(self.responses['user_id'], self.responses['points_earned']):
+            self._record_score(user_id, points)
+    
+    def _record_score(self, user_id: str, points: int):
+        """Add one answered question and its points to the user's running totals."""
+        self._scores[user_id] += points
+        self._questions_answered[user_id] += 1
     
     def create_responses_table(self) -> bool:
         """Mock table creation."""
@@ -90,10 +107,12 @@ class MockResponseManager:
                 'question_id': question_id,
                 'user_answer': user_answer,
                 'correct_answer': correct_answer,
-                'points_earned': 10 if user_answer.strip().lower() == correct_answer.strip().lower() else 0,
+                'points_earned': 10 if Config.normalize_answer(user_answer) == Config.normalize_answer(correct_answer) else 0,
                 'submitted_at': pd.Timestamp.now()
             }
-            self.responses.append(response)
+            for column in MOCK_RESPONSE_COLUMNS:
+                self.responses[column].append(response[column])
+            self._record_score(user_id, response['points_earned'])
             logger.info(f"Mock response submitted for user {user_id}, question {question_id}")
             return True
         except Exception as e:
@@ -102,43 +121,21 @@ class MockResponseManager:
     
     def get_user_score(self, user_id: str) -> int:
         """Get user's total score."""
-        return sum(r['points_earned'] for r in self.responses if r['user_id'] == user_id)
+        return self._scores[user_id]
     
     def get_leaderboard(self) -> pd.DataFrame:
         """Get mock leaderboard."""
         try:
-            # Calculate scores by user
-            user_scores = {}
-            for response in self.responses:
-                user_id = response['user_id']
-                if user_id not in user_scores:
-                    user_scores[user_id] = {'total_points': 0, 'questions_answered': 0}
-                user_scores[user_id]['total_points'] += response['points_earned']
-                user_scores[user_id]['questions_answered'] += 1
-            
-            # Build leaderboard
-            leaderboard_data = []
-            for user in self.db.mock_data['users']:
-                user_id = user['user_id']
-                if user_id in user_scores:
-                    leaderboard_data.append({
-                        'display_name': user['display_name'],
-                        'email': user['email'],
-                        'total_points': user_scores[user_id]['total_points'],
-                        'questions_answered': user_scores[user_id]['questions_answered']
-                    })
-                else:
-                    leaderboard_data.append({
-                        'display_name': user['display_name'],
-                        'email': user['email'],
-                        'total_points': 0,
-                        'questions_answered': 0
-                    })
+            # Look up each eligible user's running totals; users without answers get zeros
+            leaderboard_df = pd.DataFrame(self.db.mock_data['users'], columns=['user_id', 'display_name', 'email'])
+            score_columns = ['total_points', 'questions_answered']
+            leaderboard_df['total_points'] = [self._scores[user_id] for user_id in leaderboard_df['user_id']]
+            leaderboard_df['questions_answered'] = [self._questions_answered[user_id] for user_id in leaderboard_df['user_id']]
             
             # Sort by points descending
-            leaderboard_data.sort(key=lambda x: (x['total_points'], x['questions_answered']), reverse=True)
-            
-            return pd.DataFrame(leaderboard_data)
+            return leaderboard_df.sort_values(
+                score_columns, ascending=False, kind='stable', ignore_index=True
+            )[['display_name', 'email', *score_columns]]
             
         except Exception as e:
             logger.error(f"Error generating mock leaderboard: {str(e)}")
@@ -1,5 +1,13 @@
 """Infrastructure package for Delta Drive Workshop Setup."""
 
-from .resource_manager import SQLWarehouseManager
+from .workspace import create_pat_workspace_client
 
-__all__ = ["SQLWarehouseManager"] 
\ No newline at end of file
+__all__ = ["SQLWarehouseManager", "create_pat_workspace_client"]
+
+
+def __getattr__(name):
+    # resource_manager imports the Databricks SDK, so only load it when it is asked for
+    if name == "SQLWarehouseManager":
+        from .resource_manager import SQLWarehouseManager
+        return SQLWarehouseManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,17 +3,24 @@
 import logging
 import os
 import sys
-from typing import Dict, List, Optional, Any
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
 from dataclasses import dataclass
 
 # Import Databricks SDK - required dependency
-from databricks.sdk import WorkspaceClient
 from databricks.sdk.service.sql import CreateWarehouseRequestWarehouseType, ChannelName, Channel
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+from .workspace import create_pat_workspace_client
+
+# Logging is configured by the application entry points
 logger = logging.getLogger(__name__)
 
+# Caps in-flight warehouse API calls across all managers and threads, so concurrent
+# create/stop/delete fan-outs don't trip the workspace rate limits (HTTP 429)
+_MAX_CONCURRENT = int(os.getenv("DBX_MAX_CONCURRENT", "8"))
+_REQUEST_SEM = threading.BoundedSemaphore(_MAX_CONCURRENT)
+
 @dataclass
 class WarehouseConfig:
     """Configuration for SQL warehouse creation."""
@@ -24,8 +31,9 @@ class WarehouseConfig:
     warehouse_type: str = "PRO"
     enable_photon: bool = True
     enable_serverless_compute: bool = True
+    wait_until_running: bool = True
 
-@dataclass
+@dataclass(frozen=True)
 class WarehouseResult:
     """Result of warehouse creation."""
     name: str
@@ -37,6 +45,25 @@ class WarehouseResult:
 class SQLWarehouseManager:
     """Manages SQL warehouse creation and operations using Databricks SDK."""
     
+    # Every warehouse is created on the current release channel
+    _CHANNEL_CURRENT = Channel(name=ChannelName.CHANNEL_NAME_CURRENT)
+    
+    # Environment variables reported by the debug dump
+    _DEBUG_ENV_VARS = (
+        'DATABRICKS_RUNTIME_VERSION',
+        'DATABRICKS_TOKEN',
+        'DB_HOME',
+        'DATABRICKS_ROOT_VIRTUALENV_ENV',
+        'DATABRICKS_WORKSPACE_ID',
+        'DATABRICKS_HOST',
+        'DATABRICKS_SERVER_HOSTNAME',
+        'DATABRICKS_HTTP_PATH',
+        'DATABRICKS_ACCESS_TOKEN'
+    )
+    
+    # Environment variables whose values are masked in debug output
+    _SENSITIVE_VARS = frozenset({'DATABRICKS_TOKEN', 'DATABRICKS_ACCESS_TOKEN'})
+    
     def __init__(self, hostname: str, access_token: str):
         """
         Initialize the SQL warehouse manager using Databricks SDK.
@@ -53,17 +80,7 @@ class SQLWarehouseManager:
         
         # Initialize the Databricks SDK client
         try:
-            # Explicitly use PAT authentication and ignore OAuth environment variables
-            # Clean hostname to avoid double https:// prefix
-            clean_hostname = hostname.replace("https://", "").replace("http://", "")
-            self.workspace_client = WorkspaceClient(
-                host=f"https://{clean_hostname}",
-                token=access_token,
-                auth_type="pat"  # Explicitly set to Personal Access Token authentication
-            )
-            
-            # Test the SDK connection by checking if we can access the client
-            _ = self.workspace_client.warehouses
+            self.workspace_client = create_pat_workspace_client(hostname, access_token)
             logger.info(f"✅ Successfully initialized SQL Warehouse Manager with Databricks SDK for {hostname}")
             
         except Exception as e:
@@ -71,44 +88,33 @@ class SQLWarehouseManager:
             raise RuntimeError(f"Could not initialize Databricks SDK: {e}")
         
         # Log environment information for debugging
-        self._log_environment_info()
+        if logger.isEnabledFor(logging.DEBUG):
+            self._log_environment_info()
     
 
     
     def _log_environment_info(self):
         """Log environment information for debugging."""
-        logger.info("=== Environment Debug Information ===")
-        env_vars_to_check = [
-            'DATABRICKS_RUNTIME_VERSION',
-            'DATABRICKS_TOKEN',
-            'DB_HOME',
-            'DATABRICKS_ROOT_VIRTUALENV_ENV',
-            'DATABRICKS_WORKSPACE_ID',
-            'DATABRICKS_HOST',
-            'DATABRICKS_SERVER_HOSTNAME',
-            'DATABRICKS_HTTP_PATH',
-            'DATABRICKS_ACCESS_TOKEN'
-        ]
-        
-        for var in env_vars_to_check:
+        logger.debug("=== Environment Debug Information ===")
+        for var in self._DEBUG_ENV_VARS:
             value = os.getenv(var)
             if value:
                 # Mask sensitive tokens
-                if 'TOKEN' in var or 'ACCESS' in var:
+                if var in self._SENSITIVE_VARS:
                     masked_value = f"{value[:10]}..." if len(value) > 10 else "***"
-                    logger.info(f"  {var}: {masked_value}")
+                    logger.debug(f"  {var}: {masked_value}")
                 else:
-                    logger.info(f"  {var}: {value}")
+                    logger.debug(f"  {var}: {value}")
             else:
-                logger.info(f"  {var}: Not set")
+                logger.debug(f"  {var}: Not set")
         
-        logger.info("=== End Environment Debug Information ===")
+        logger.debug("=== End Environment Debug Information ===")
         
         # Also log the current working directory and other system info
-        logger.info(f"Current working directory: {os.getcwd()}")
-        logger.info(f"Python executable: {sys.executable}")
-        logger.info(f"User: {os.getenv('USER', 'Unknown')}")
-        logger.info(f"Home: {os.getenv('HOME', 'Unknown')}")
+        logger.debug(f"Current working directory: {os.getcwd()}")
+        logger.debug(f"Python executable: {sys.executable}")
+        logger.debug(f"User: {os.getenv('USER', 'Unknown')}")
+        logger.debug(f"Home: {os.getenv('HOME', 'Unknown')}")
     
     def create_warehouse(self, config: WarehouseConfig) -> WarehouseResult:
         """
@@ -127,60 +133,64 @@ class SQLWarehouseManager:
         try:
             logger.info(f"Creating warehouse '{config.name}' with size '{config.cluster_size}' using Databricks SDK")
             
-            # Create channel configuration
-            channel = Channel(name=ChannelName.CHANNEL_NAME_CURRENT)
-            
             # Make the API call using SDK with keyword arguments
-            warehouse_wait = self.workspace_client.warehouses.create(
-                name=config.name,
-                cluster_size=config.cluster_size,
-                auto_stop_mins=config.auto_stop_mins,
-                max_num_clusters=config.max_num_clusters,
-                warehouse_type=CreateWarehouseRequestWarehouseType.PRO,
-                enable_photon=config.enable_photon,
-                enable_serverless_compute=config.enable_serverless_compute,
-                channel=channel
-            )
-            
-            # Wait for the warehouse to be created
-            warehouse_response = warehouse_wait.result()
-            
-            if warehouse_response.id:
-                result = WarehouseResult(
+            with _REQUEST_SEM:
+                warehouse_wait = self.workspace_client.warehouses.create(
                     name=config.name,
-                    id=warehouse_response.id,
-                    http_path=f"/sql/1.0/warehouses/{warehouse_response.id}",
-                    success=True
+                    cluster_size=config.cluster_size,
+                    auto_stop_mins=config.auto_stop_mins,
+                    max_num_clusters=config.max_num_clusters,
+                    warehouse_type=CreateWarehouseRequestWarehouseType.PRO,
+                    enable_photon=config.enable_photon,
+                    enable_serverless_compute=config.enable_serverless_compute,
+                    channel=self._CHANNEL_CURRENT
                 )
-                logger.info(f"Successfully created warehouse using SDK: {warehouse_response.id}")
-                return result
+            
+            if config.wait_until_running:
+                # Wait for the warehouse to reach RUNNING so the first query doesn't hit a cold start
+                warehouse_id = warehouse_wait.result().id
+            else:
+                warehouse_id = warehouse_wait.id
+            
+            if warehouse_id:
+                logger.info(f"Successfully created warehouse using SDK: {warehouse_id}")
+                return self._ok(config.name, warehouse_id)
             else:
                 error_msg = "No warehouse ID in SDK response"
                 logger.error(f"Error creating warehouse: {error_msg}")
-                return WarehouseResult(
-                    name=config.name,
-                    id="",
-                    http_path="",
-                    success=False,
-                    error=error_msg
-                )
+                return self._fail(config.name, error_msg)
                 
         except Exception as e:
             error_msg = f"SDK error: {str(e)}"
             logger.error(f"Error creating warehouse with SDK: {error_msg}")
-            return WarehouseResult(
-                name=config.name,
-                id="",
-                http_path="",
-                success=False,
-                error=error_msg
-            )
+            return self._fail(config.name, error_msg)
+    
+    @staticmethod
+    def _ok(name: str, warehouse_id: str) -> WarehouseResult:
+        """Result for a warehouse that was created."""
+        return WarehouseResult(
+            name=name,
+            id=warehouse_id,
+            http_path=f"/sql/1.0/warehouses/{warehouse_id}",
+            success=True
+        )
+    
+    @staticmethod
+    def _fail(name: str, error: str) -> WarehouseResult:
+        """Result for a warehouse that could not be created."""
+        return WarehouseResult(
+            name=name,
+            id="",
+            http_path="",
+            success=False,
+            error=error
+        )
     
 
     
     def create_multiple_warehouses(self, base_name: str, cluster_size: str, auto_stop_mins: int, count: int) -> List[WarehouseResult]:
         """
-        Create multiple SQL warehouses.
+        Create multiple SQL warehouses concurrently.
         
         Args:
             base_name: Base name for warehouses
@@ -191,7 +201,7 @@ class SQLWarehouseManager:
         Returns:
             List of WarehouseResult objects
         """
-        results = []
+        configs = []
         
         for i in range(count):
             if count > 1:
@@ -199,20 +209,18 @@ class SQLWarehouseManager:
             else:
                 warehouse_name = base_name
             
-            config = WarehouseConfig(
+            configs.append(WarehouseConfig(
                 name=warehouse_name,
                 cluster_size=cluster_size,
                 auto_stop_mins=auto_stop_mins
-            )
-            
-            result = self.create_warehouse(config)
-            results.append(result)
-            
-            # Add a small delay between requests to avoid rate limiting
-            import time
-            time.sleep(1)
+            ))
+        
+        if not configs:
+            return []
         
-        return results
+        # Creation is network-bound, so issue the requests concurrently; map() keeps input order
+        with ThreadPoolExecutor(max_workers=min(len(configs), _MAX_CONCURRENT)) as executor:
+            return list(executor.map(self.create_warehouse, configs))
     
     def list_warehouses(self) -> List[Dict[str, Any]]:
         """
@@ -221,25 +229,8 @@ class SQLWarehouseManager:
         Returns:
             List of warehouse information dictionaries
         """
-        return self._list_warehouses_with_sdk()
-    
-    def _list_warehouses_with_sdk(self) -> List[Dict[str, Any]]:
-        """List warehouses using Databricks SDK."""
         try:
-            warehouses = list(self.workspace_client.warehouses.list())
-            warehouse_dicts = []
-            
-            for warehouse in warehouses:
-                warehouse_dict = {
-                    "id": warehouse.id,
-                    "name": warehouse.name,
-                    "cluster_size": warehouse.cluster_size,
-                    "auto_stop_mins": warehouse.auto_stop_mins,
-                    "state": warehouse.state,
-                    "warehouse_type": warehouse.warehouse_type
-                }
-                warehouse_dicts.append(warehouse_dict)
-            
+            warehouse_dicts = self._list_warehouses_with_sdk()
             logger.info(f"Found {len(warehouse_dicts)} warehouses using SDK")
             return warehouse_dicts
             
@@ -247,6 +238,24 @@ class SQLWarehouseManager:
             logger.error(f"Error listing warehouses with SDK: {str(e)}")
             return []
     
+    def _list_warehouses_with_sdk(self) -> List[Dict[str, Any]]:
+        """List warehouses using Databricks SDK."""
+        # Fetch every page while holding the permit, so a slow or abandoned consumer can't keep it
+        with _REQUEST_SEM:
+            warehouses = list(self.workspace_client.warehouses.list())
+        
+        return [
+            {
+                "id": warehouse.id,
+                "name": warehouse.name,
+                "cluster_size": warehouse.cluster_size,
+                "auto_stop_mins": warehouse.auto_stop_mins,
+                "state": warehouse.state,
+                "warehouse_type": warehouse.warehouse_type
+            }
+            for warehouse in warehouses
+        ]
+    
 
     
     def delete_warehouse(self, warehouse_id: str) -> bool:
@@ -264,7 +273,8 @@ class SQLWarehouseManager:
     def _delete_warehouse_with_sdk(self, warehouse_id: str) -> bool:
         """Delete warehouse using Databricks SDK."""
         try:
-            self.workspace_client.warehouses.delete(warehouse_id)
+            with _REQUEST_SEM:
+                self.workspace_client.warehouses.delete(warehouse_id)
             logger.info(f"Successfully deleted warehouse using SDK: {warehouse_id}")
             return True
             
@@ -272,6 +282,29 @@ class SQLWarehouseManager:
             logger.error(f"Error deleting warehouse {warehouse_id} with SDK: {str(e)}")
             return False
     
+    def delete_multiple_warehouses(self, warehouse_ids: List[str], stop_first: bool = False) -> Dict[str, bool]:
+        """
+        Delete multiple SQL warehouses concurrently.
+
+        Args:
+            warehouse_ids: IDs of the warehouses to delete
+            stop_first: Stop each warehouse before deleting it
+
+        Returns:
+            Mapping of warehouse ID to whether its deletion was successful
+        """
+        if not warehouse_ids:
+            return {}
+
+        def delete(warehouse_id: str) -> bool:
+            if stop_first:
+                self.stop_warehouse(warehouse_id)
+            return self.delete_warehouse(warehouse_id)
+
+        # Deletion is network-bound too; the shared semaphore still caps in-flight calls
+        with ThreadPoolExecutor(max_workers=min(len(warehouse_ids), _MAX_CONCURRENT)) as executor:
+            return dict(zip(warehouse_ids, executor.map(delete, warehouse_ids)))
+
     def stop_warehouse(self, warehouse_id: str) -> bool:
         """
         Stop a SQL warehouse using Databricks SDK.
@@ -283,7 +316,8 @@ class SQLWarehouseManager:
             True if stopping was successful, False otherwise
         """
         try:
-            self.workspace_client.warehouses.stop(warehouse_id)
+            with _REQUEST_SEM:
+                self.workspace_client.warehouses.stop(warehouse_id)
             logger.info(f"Successfully stopped warehouse using SDK: {warehouse_id}")
             return True
             
@@ -302,7 +336,8 @@ class SQLWarehouseManager:
             True if starting was successful, False otherwise
         """
         try:
-            self.workspace_client.warehouses.start(warehouse_id)
+            with _REQUEST_SEM:
+                self.workspace_client.warehouses.start(warehouse_id)
             logger.info(f"Successfully started warehouse using SDK: {warehouse_id}")
             return True
             
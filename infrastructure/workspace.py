@@ -0,0 +1,25 @@
+"""Shared PAT-authenticated WorkspaceClient factory."""
+
+import functools
+from typing import TYPE_CHECKING
+
+# The Databricks SDK is slow to import, so it is only loaded once a client is first built
+if TYPE_CHECKING:
+    from databricks.sdk import WorkspaceClient
+
+
+@functools.lru_cache(maxsize=16)
+def create_pat_workspace_client(hostname: str, access_token: str) -> "WorkspaceClient":
+    """Return a PAT-authenticated WorkspaceClient for a workspace.
+    
+    Cached per (hostname, token), so the app's callbacks and every SQLWarehouseManager reuse
+    one client and its HTTP session instead of re-resolving config and TLS setup each time.
+    """
+    from databricks.sdk import WorkspaceClient
+
+    # Clean hostname to avoid double https:// prefix
+    clean_hostname = hostname.replace("https://", "").replace("http://", "")
+
+    # An explicit auth_type makes the SDK use only the token, even when the app's
+    # OAuth env vars (DATABRICKS_CLIENT_ID/SECRET) are also set, so they can stay put
+    return WorkspaceClient(host=f"https://{clean_hostname}", token=access_token, auth_type="pat")
@@ -1,12 +1,16 @@
 """Main Delta Scoreboard Dash application."""
 
 import dash
-from dash import dcc, html, Input, Output, State, callback, dash_table
+from dash import dcc, html, Input, Output, State, MATCH, ClientsideFunction, callback, ctx, dash_table
 import dash_bootstrap_components as dbc
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime
+import functools
+import hashlib
+import json
 import logging
 from typing import Dict, List, Optional
 
@@ -18,7 +22,8 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Initialize Dash app
-app = dash.Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP], suppress_callback_exceptions=True)
+# compress=True gzips callback responses; leaderboard JSON shrinks several-fold
+app = dash.Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP], suppress_callback_exceptions=True, compress=True)
 app.title = "Delta Scoreboard - Workshop Leaderboard"
 
 # Global variables
@@ -61,6 +66,9 @@ WORKSHOP_QUESTIONS = [
     }
 ]
 
+# Questions keyed by their id, which is also the question number shown in the UI
+QUESTIONS_BY_ID = {question["id"]: question for question in WORKSHOP_QUESTIONS}
+
 def initialize_app_with_credentials(hostname: str, workspace_id: str, http_path: str, token: str):
     """Initialize the database connection and managers with runtime credentials."""
     global db_connection, user_manager, response_manager
@@ -98,9 +106,11 @@ def create_header():
         className="mb-4"
     )
 
+# Page factories are cached: their trees never change and are only serialized per
+# response, so every navigation can return the same components
+@functools.lru_cache(maxsize=1)
 def create_credentials_form():
     """Create the credentials setup form."""
-    logger.info("Creating credentials form with Workspace ID field")
     return dbc.Container([
         dbc.Row([
             dbc.Col([
@@ -163,6 +173,7 @@ def create_credentials_form():
         ], justify="center")
     ])
 
+@functools.lru_cache(maxsize=1)
 def create_login_form():
     """Create the login form for user authentication."""
     return dbc.Container([
@@ -190,30 +201,33 @@ def create_login_form():
 
 def create_question_form(question_num: int):
     """Create a form for a specific question."""
-    if question_num > len(WORKSHOP_QUESTIONS):
+    question = QUESTIONS_BY_ID.get(question_num)
+    if question is None:
         return html.Div("No more questions available!")
     
-    question = WORKSHOP_QUESTIONS[question_num - 1]
-    
     return dbc.Card([
         dbc.CardBody([
             html.H5(f"Question {question_num}", className="card-title"),
             html.P(question["question"], className="card-text mb-3"),
             dbc.RadioItems(
-                id=f"question-{question_num}-options",
+                id={"type": "question-options", "index": question_num},
                 options=[{"label": option, "value": option} for option in question["options"]],
                 className="mb-3"
             ),
             dbc.Button(
                 "Submit Answer",
-                id=f"submit-question-{question_num}",
+                id={"type": "submit-question", "index": question_num},
                 color="success",
                 className="me-2"
             ),
-            html.Div(id=f"question-{question_num}-feedback", className="mt-3")
+            html.Div(id={"type": "question-feedback", "index": question_num}, className="mt-3")
         ])
     ], className="mb-3")
 
+# The questions never change, so their cards are built once and reused for every page load
+QUESTION_CARDS = [create_question_form(i) for i in range(1, len(WORKSHOP_QUESTIONS) + 1)]
+
+@functools.lru_cache(maxsize=1)
 def create_questions_page():
     """Create the questions page."""
     return dbc.Container([
@@ -228,6 +242,7 @@ def create_questions_page():
         ])
     ])
 
+@functools.lru_cache(maxsize=1)
 def create_leaderboard():
     """Create the leaderboard display."""
     return dbc.Container([
@@ -235,6 +250,9 @@ def create_leaderboard():
             dbc.Col([
                 html.H3("🏆 Workshop Leaderboard", className="mb-4"),
                 html.Div(id="leaderboard-container"),
+                create_leaderboard_table(),
+                # Digest of the rows the table shows; refreshes compare against it instead of the rows
+                dcc.Store(id="leaderboard-hash"),
                 html.Hr(),
                 dbc.Button("Back to Questions", id="back-to-questions-btn", color="primary", className="mb-3"),
                 dbc.Button("Refresh Leaderboard", id="refresh-leaderboard-btn", color="secondary", className="mb-3 ms-2")
@@ -242,18 +260,74 @@ def create_leaderboard():
         ])
     ])
 
+# Leaderboard table headers
+LEADERBOARD_COLUMNS = [
+    {"name": column, "id": column} for column in ("Rank", "Participant", "Email", "Score", "Questions", "Progress")
+]
+
+def build_leaderboard_records(leaderboard_df: pd.DataFrame) -> List[Dict]:
+    """Build the leaderboard table rows, computing each column with vectorized operations."""
+    ranks = np.arange(1, len(leaderboard_df) + 1)
+    total_points = leaderboard_df['total_points'].to_numpy()
+    max_possible_score = len(WORKSHOP_QUESTIONS) * Config.POINTS_PER_QUESTION
+    progress_percentage = total_points / max_possible_score * 100 if max_possible_score > 0 else np.zeros(len(ranks))
+    
+    return pd.DataFrame({
+        "Rank": np.select([ranks == 1, ranks == 2, ranks == 3], ["🥇", "🥈", "🥉"], default=np.char.add("#", ranks.astype(str))),
+        "Participant": leaderboard_df['display_name'].to_numpy(),
+        "Email": leaderboard_df['email'].to_numpy(),
+        "Score": [f"{points} pts" for points in total_points],
+        "Questions": [f"{answered}/{len(WORKSHOP_QUESTIONS)}" for answered in leaderboard_df['questions_answered'].to_numpy()],
+        "Progress": [f"{percentage:.0f}%" for percentage in progress_percentage]
+    }).to_dict('records')
+
+def leaderboard_records_hash(records: List[Dict]) -> str:
+    """Digest of leaderboard rows, so a refresh can tell whether they changed without resending them."""
+    return hashlib.sha256(json.dumps(records, default=str).encode()).hexdigest()
+
+def create_leaderboard_table():
+    """Create the leaderboard table; its rows are filled in by the load_leaderboard callback."""
+    # Rendered client-side from one records list instead of a component per cell
+    return dash_table.DataTable(
+        id="leaderboard-table",
+        data=[],
+        columns=LEADERBOARD_COLUMNS,
+        page_action='none',
+        style_table={'overflowX': 'auto'},
+        style_cell={'textAlign': 'center', 'verticalAlign': 'middle'},
+        style_cell_conditional=[
+            {'if': {'column_id': column}, 'textAlign': 'left'} for column in ("Participant", "Email")
+        ] + [
+            {'if': {'column_id': 'Participant'}, 'fontWeight': 'bold'},
+            {'if': {'column_id': 'Score'}, 'fontWeight': 'bold', 'color': '#0d6efd'}
+        ],
+        # Highlight the podium rows
+        style_data_conditional=[
+            {'if': {'row_index': 0}, 'backgroundColor': '#fff3cd'},
+            {'if': {'row_index': 1}, 'backgroundColor': '#f8f9fa'},
+            {'if': {'row_index': 2}, 'backgroundColor': '#cff4fc'}
+        ]
+    )
+
 # App layout
 app.layout = dbc.Container([
     dcc.Store(id="user-data", data=None),
     dcc.Store(id="credentials-data", data=None),
     dcc.Store(id="app-state", data={"page": "credentials", "question_num": 1}),
-    dcc.Interval(id="auto-refresh", interval=30000, n_intervals=0),  # Auto-refresh every 30 seconds
+    dcc.Interval(id="auto-refresh", interval=30000, n_intervals=0, disabled=True),  # Auto-refresh every 30 seconds on the leaderboard
     
     create_header(),
     
     html.Div(id="page-content", children=create_credentials_form())
 ], fluid=True)
 
+# Only tick auto-refresh while the leaderboard is showing (see assets/clientside.js)
+app.clientside_callback(
+    ClientsideFunction(namespace="ui", function_name="autoRefreshDisabled"),
+    Output("auto-refresh", "disabled"),
+    Input("app-state", "data")
+)
+
 # Callbacks
 @app.callback(
     [Output("page-content", "children"),
@@ -263,8 +337,7 @@ app.layout = dbc.Container([
     [Input("connect-btn", "n_clicks"),
      Input("login-btn", "n_clicks"),
      Input("view-leaderboard-btn", "n_clicks"),
-     Input("back-to-questions-btn", "n_clicks"),
-     Input("auto-refresh", "n_intervals")],
+     Input("back-to-questions-btn", "n_clicks")],
     [State("hostname-input", "value"),
      State("workspace-id-input", "value"),
      State("http-path-input", "value"),
@@ -272,15 +345,17 @@ app.layout = dbc.Container([
      State("email-input", "value"),
      State("user-data", "data"),
      State("credentials-data", "data"),
-     State("app-state", "data")]
+     State("app-state", "data")],
+    # The layout already starts on the credentials form
+    prevent_initial_call=True
 )
-def handle_navigation(connect_clicks, login_clicks, leaderboard_clicks, back_clicks, auto_refresh,
+def handle_navigation(connect_clicks, login_clicks, leaderboard_clicks, back_clicks,
                      hostname, workspace_id, http_path, token, email, user_data, credentials_data, app_state):
     """Handle navigation between pages."""
     ctx = dash.callback_context
     
     # Debug logging
-    logger.info(f"Navigation callback triggered: {ctx.triggered}")
+    logger.debug("Navigation callback triggered: %s", ctx.triggered)
     
     if not ctx.triggered:
         logger.info("No trigger found, returning credentials form")
@@ -321,10 +396,6 @@ def handle_navigation(connect_clicks, login_clicks, leaderboard_clicks, back_cli
         app_state["page"] = "questions"
         return create_questions_page(), user_data, credentials_data, app_state
     
-    # Handle auto-refresh
-    elif trigger_id == "auto-refresh" and app_state and app_state.get("page") == "leaderboard":
-        return create_leaderboard(), user_data, credentials_data, app_state
-    
     # Default state based on current page
     if not credentials_data:
         return create_credentials_form(), None, None, {"page": "credentials", "question_num": 1}
@@ -339,184 +410,103 @@ def handle_navigation(connect_clicks, login_clicks, leaderboard_clicks, back_cli
 
 @app.callback(
     Output("questions-container", "children"),
-    Input("page-content", "children"),
-    State("app-state", "data")
+    Input("app-state", "data")
 )
-def load_questions(page_content, app_state):
+def load_questions(app_state):
     """Load questions when on the questions page."""
     if app_state and app_state.get("page") == "questions":
-        return [create_question_form(i) for i in range(1, len(WORKSHOP_QUESTIONS) + 1)]
+        return QUESTION_CARDS
     return []
 
 @app.callback(
-    Output("leaderboard-container", "children"),
-    [Input("page-content", "children"),
+    [Output("leaderboard-table", "data"),
+     Output("leaderboard-container", "children"),
+     Output("leaderboard-hash", "data")],
+    [Input("app-state", "data"),
      Input("refresh-leaderboard-btn", "n_clicks"),
      Input("auto-refresh", "n_intervals")],
-    State("app-state", "data")
+    State("leaderboard-hash", "data")
 )
-def load_leaderboard(page_content, refresh_clicks, auto_refresh, app_state):
-    """Load and display the leaderboard."""
+def load_leaderboard(app_state, refresh_clicks, auto_refresh, current_hash):
+    """Load the leaderboard rows, sending only the table data and only when it changed."""
     if app_state and app_state.get("page") == "leaderboard":
         try:
             if response_manager:
                 leaderboard_df = response_manager.get_leaderboard()
+                records = build_leaderboard_records(leaderboard_df)
+                records_hash = leaderboard_records_hash(records)
                 
-                if not leaderboard_df.empty:
-                    # Create a professional leaderboard table
-                    table_header = [
-                        html.Thead([
-                            html.Tr([
-                                html.Th("Rank", className="text-center"),
-                                html.Th("Participant", className="text-start"),
-                                html.Th("Email", className="text-start"),
-                                html.Th("Score", className="text-center"),
-                                html.Th("Questions", className="text-center"),
-                                html.Th("Progress", className="text-center")
-                            ])
-                        ])
-                    ]
-                    
-                    table_rows = []
-                    for i, row in leaderboard_df.iterrows():
-                        rank = i + 1
-                        medal = "🥇" if rank == 1 else "🥈" if rank == 2 else "🥉" if rank == 3 else f"#{rank}"
-                        
-                        # Calculate progress percentage
-                        max_possible_score = len(WORKSHOP_QUESTIONS) * Config.POINTS_PER_QUESTION
-                        progress_percentage = (row['total_points'] / max_possible_score * 100) if max_possible_score > 0 else 0
-                        
-                        # Style the row based on rank
-                        row_class = ""
-                        if rank == 1:
-                            row_class = "table-warning"
-                        elif rank == 2:
-                            row_class = "table-light"
-                        elif rank == 3:
-                            row_class = "table-info"
-                        
-                        table_rows.append(
-                            html.Tr([
-                                html.Td(
-                                    html.Span(medal, className="h4 mb-0"),
-                                    className="text-center align-middle"
-                                ),
-                                html.Td(
-                                    html.Div([
-                                        html.Strong(row['display_name'], className="d-block"),
-                                        html.Small(f"User #{i+1}", className="text-muted")
-                                    ]),
-                                    className="align-middle"
-                                ),
-                                html.Td(row['email'], className="align-middle"),
-                                html.Td(
-                                    html.Div([
-                                        html.Span(f"{row['total_points']}", className="h5 text-primary mb-0"),
-                                        html.Small(" pts", className="text-muted")
-                                    ]),
-                                    className="text-center align-middle"
-                                ),
-                                html.Td(
-                                    html.Div([
-                                        html.Span(f"{row['questions_answered']}", className="h6 mb-0"),
-                                        html.Small(f"/{len(WORKSHOP_QUESTIONS)}", className="text-muted")
-                                    ]),
-                                    className="text-center align-middle"
-                                ),
-                                html.Td(
-                                    html.Div([
-                                        dbc.Progress(
-                                            value=progress_percentage,
-                                            color="success" if progress_percentage == 100 else "primary",
-                                            className="mb-1"
-                                        ),
-                                        html.Small(f"{progress_percentage:.0f}%", className="text-muted")
-                                    ]),
-                                    className="text-center align-middle"
-                                )
-                            ], className=row_class)
-                        )
-                    
-                    table_body = [html.Tbody(table_rows)]
-                    
-                    return [
-                        html.Div([
-                            html.H5(f"🏆 Workshop Leaderboard - {len(leaderboard_df)} Participants", className="mb-3"),
-                            dbc.Table(
-                                table_header + table_body,
-                                bordered=True,
-                                hover=True,
-                                striped=True,
-                                responsive=True,
-                                className="shadow-sm"
-                            )
-                        ])
-                    ]
+                # Same standings as the browser already shows: skip the round-trip entirely
+                if records_hash == current_hash:
+                    return dash.no_update, dash.no_update, dash.no_update
+                
+                if records:
+                    return records, html.H5(f"🏆 Workshop Leaderboard - {len(records)} Participants", className="mb-3"), records_hash
                 else:
-                    return [
-                        html.Div([
-                            html.H5("🏆 Workshop Leaderboard", className="mb-3"),
-                            dbc.Alert([
-                                html.I(className="fas fa-info-circle me-2"),
-                                "No scores yet. Be the first to answer questions!"
-                            ], color="info", className="text-center")
-                        ])
-                    ]
+                    return records, html.Div([
+                        html.H5("🏆 Workshop Leaderboard", className="mb-3"),
+                        dbc.Alert([
+                            html.I(className="fas fa-info-circle me-2"),
+                            "No scores yet. Be the first to answer questions!"
+                        ], color="info", className="text-center")
+                    ]), records_hash
             else:
-                return [
-                    dbc.Alert([
-                        html.I(className="fas fa-exclamation-triangle me-2"),
-                        "Unable to load leaderboard. Please check your connection."
-                    ], color="warning", className="text-center")
-                ]
+                return [], dbc.Alert([
+                    html.I(className="fas fa-exclamation-triangle me-2"),
+                    "Unable to load leaderboard. Please check your connection."
+                ], color="warning", className="text-center"), None
         except Exception as e:
             logger.error(f"Error loading leaderboard: {str(e)}")
-            return [
-                dbc.Alert([
-                    html.I(className="fas fa-times-circle me-2"),
-                    "Error loading leaderboard."
-                ], color="danger", className="text-center")
-            ]
+            return [], dbc.Alert([
+                html.I(className="fas fa-times-circle me-2"),
+                "Error loading leaderboard."
+            ], color="danger", className="text-center"), None
     
-    return []
+    return dash.no_update, dash.no_update, dash.no_update
 
-# Dynamic callbacks for question submissions
-for i in range(1, len(WORKSHOP_QUESTIONS) + 1):
-    @app.callback(
-        Output(f"question-{i}-feedback", "children"),
-        Input(f"submit-question-{i}", "n_clicks"),
-        [State(f"question-{i}-options", "value"),
-         State("user-data", "data")]
-    )
-    def submit_answer(n_clicks, selected_answer, user_data, question_num=i):
-        """Submit an answer for a question."""
-        if n_clicks and selected_answer and user_data:
-            try:
-                question = WORKSHOP_QUESTIONS[question_num - 1]
-                correct_answer = question["correct_answer"]
+# One pattern-matching callback handles the submit button of every question
+@app.callback(
+    [Output({"type": "question-feedback", "index": MATCH}, "children"),
+     Output({"type": "submit-question", "index": MATCH}, "disabled")],
+    Input({"type": "submit-question", "index": MATCH}, "n_clicks"),
+    [State({"type": "question-options", "index": MATCH}, "value"),
+     State("user-data", "data")],
+    # Nothing to submit when a question card is first rendered
+    prevent_initial_call=True,
+    # Block repeat clicks while the answer is being recorded
+    running=[(Output({"type": "submit-question", "index": MATCH}, "disabled"), True, False)]
+)
+def submit_answer(n_clicks, selected_answer, user_data):
+    """Submit an answer for a question."""
+    if n_clicks and selected_answer and user_data:
+        try:
+            question_num = ctx.triggered_id["index"]
+            correct_answer = QUESTIONS_BY_ID[question_num]["correct_answer"]
+            
+            if response_manager:
+                success = response_manager.submit_response(
+                    user_data["user_id"], 
+                    question_num, 
+                    selected_answer, 
+                    correct_answer
+                )
                 
-                if response_manager:
-                    success = response_manager.submit_response(
-                        user_data["user_id"], 
-                        question_num, 
-                        selected_answer, 
-                        correct_answer
-                    )
-                    
-                    if success:
-                        if selected_answer == correct_answer:
-                            return dbc.Alert("Correct! ✅", color="success")
-                        else:
-                            return dbc.Alert(f"Incorrect. The correct answer is: {correct_answer}", color="warning")
+                # A recorded answer disables the button, so the same answer isn't written twice
+                if success:
+                    if selected_answer == correct_answer:
+                        return dbc.Alert("Correct! ✅", color="success"), True
                     else:
-                        return dbc.Alert("Error submitting answer. Please try again.", color="danger")
+                        return dbc.Alert(f"Incorrect. The correct answer is: {correct_answer}", color="warning"), True
                 else:
-                    return dbc.Alert("Database connection error.", color="danger")
-            except Exception as e:
-                logger.error(f"Error submitting answer: {str(e)}")
-                return dbc.Alert("Error submitting answer.", color="danger")
-        
-        return ""
+                    return dbc.Alert("Error submitting answer. Please try again.", color="danger"), False
+            else:
+                return dbc.Alert("Database connection error.", color="danger"), False
+        except Exception as e:
+            logger.error(f"Error submitting answer: {str(e)}")
+            return dbc.Alert("Error submitting answer.", color="danger"), False
+    
+    # Incomplete submission: leave any earlier feedback untouched
+    return dash.no_update, dash.no_update
 
 # Add callback for login feedback
 @app.callback(
@@ -543,7 +533,9 @@ def handle_login_feedback(n_clicks, email, credentials_data):
     [State("hostname-input", "value"),
      State("workspace-id-input", "value"),
      State("http-path-input", "value"),
-     State("token-input", "value")]
+     State("token-input", "value")],
+    # Connecting syncs every workspace user, so block repeat clicks until it finishes
+    running=[(Output("connect-btn", "disabled"), True, False)]
 )
 def handle_connection(n_clicks, hostname, workspace_id, http_path, token):
     """Handle connection attempt and provide feedback."""
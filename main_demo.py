@@ -1,12 +1,13 @@
 """Demo version of Delta Scoreboard Dash application for testing without Databricks."""
 
 import dash
-from dash import dcc, html, Input, Output, State, callback, dash_table
+from dash import dcc, html, Input, Output, State, MATCH, ClientsideFunction, callback, ctx, dash_table
 import dash_bootstrap_components as dbc
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime
+import functools
 import logging
 from typing import Dict, List, Optional
 import os
@@ -19,7 +20,7 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Initialize Dash app
-app = dash.Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP], suppress_callback_exceptions=True)
+app = dash.Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP])
 app.title = "Delta Scoreboard - Workshop Leaderboard (Demo)"
 
 # Global variables
@@ -61,6 +62,9 @@ WORKSHOP_QUESTIONS = [
     }
 ]
 
+# Questions keyed by their id, which is also the question number shown in the UI
+QUESTIONS_BY_ID = {question["id"]: question for question in WORKSHOP_QUESTIONS}
+
 def initialize_demo_app():
     """Initialize the demo app with mock data."""
     global db_connection, user_manager, response_manager
@@ -91,6 +95,9 @@ def create_demo_info():
         html.P("Try logging in with: demo@example.com, test@example.com, or admin@example.com")
     ], color="info", className="mb-4")
 
+# Page factories are cached: their trees never change and are only serialized per
+# response, so every navigation can return the same components
+@functools.lru_cache(maxsize=1)
 def create_login_form():
     """Create the login form for user authentication."""
     return dbc.Container([
@@ -119,30 +126,33 @@ def create_login_form():
 
 def create_question_form(question_num: int):
     """Create a form for a specific question."""
-    if question_num > len(WORKSHOP_QUESTIONS):
+    question = QUESTIONS_BY_ID.get(question_num)
+    if question is None:
         return html.Div("No more questions available!")
     
-    question = WORKSHOP_QUESTIONS[question_num - 1]
-    
     return dbc.Card([
         dbc.CardBody([
             html.H5(f"Question {question_num}", className="card-title"),
             html.P(question["question"], className="card-text mb-3"),
             dbc.RadioItems(
-                id=f"question-{question_num}-options",
+                id={"type": "question-options", "index": question_num},
                 options=[{"label": option, "value": option} for option in question["options"]],
                 className="mb-3"
             ),
             dbc.Button(
                 "Submit Answer",
-                id=f"submit-question-{question_num}",
+                id={"type": "submit-question", "index": question_num},
                 color="success",
                 className="me-2"
             ),
-            html.Div(id=f"question-{question_num}-feedback", className="mt-3")
+            html.Div(id={"type": "question-feedback", "index": question_num}, className="mt-3")
         ])
     ], className="mb-3")
 
+# The questions never change, so their cards are built once and reused for every page load
+QUESTION_CARDS = [create_question_form(i) for i in range(1, len(WORKSHOP_QUESTIONS) + 1)]
+
+@functools.lru_cache(maxsize=1)
 def create_questions_page():
     """Create the questions page."""
     return dbc.Container([
@@ -157,12 +167,21 @@ def create_questions_page():
         ])
     ])
 
+# Leaderboard polling in ms: every 10 seconds, doubling up to a minute while nothing changes
+AUTO_REFRESH_INTERVAL = 10000
+AUTO_REFRESH_MAX_INTERVAL = 60000
+
+# Row fields the clientside leaderboard renderer needs
+LEADERBOARD_ROW_COLUMNS = ['display_name', 'email', 'total_points', 'questions_answered']
+
+@functools.lru_cache(maxsize=1)
 def create_leaderboard():
     """Create the leaderboard display."""
     return dbc.Container([
         dbc.Row([
             dbc.Col([
                 html.H3("🏆 Workshop Leaderboard", className="mb-4"),
+                dcc.Store(id="leaderboard-data"),
                 html.Div(id="leaderboard-container"),
                 html.Hr(),
                 dbc.Button("Back to Questions", id="back-to-questions-btn", color="primary", className="mb-3"),
@@ -175,27 +194,39 @@ def create_leaderboard():
 app.layout = dbc.Container([
     dcc.Store(id="user-data", data=None),
     dcc.Store(id="app-state", data={"page": "login", "question_num": 1}),
-    dcc.Interval(id="auto-refresh", interval=10000, n_intervals=0),  # Auto-refresh every 10 seconds for demo
+    dcc.Interval(id="auto-refresh", interval=AUTO_REFRESH_INTERVAL, n_intervals=0, disabled=True),  # Auto-refresh on the leaderboard
     
     create_header(),
     
-    html.Div(id="page-content")
+    html.Div(id="page-content", children=create_login_form())
 ], fluid=True)
 
-# Callbacks (same as main app)
+# Every page that can be swapped into page-content, so Dash can check callback ids
+# against the full set of components instead of suppressing those errors
+app.validation_layout = html.Div([app.layout, create_questions_page(), create_leaderboard(), *QUESTION_CARDS])
+
+# Only tick auto-refresh while the leaderboard is showing (see assets/clientside.js)
+app.clientside_callback(
+    ClientsideFunction(namespace="ui", function_name="autoRefreshDisabled"),
+    Output("auto-refresh", "disabled"),
+    Input("app-state", "data")
+)
+
+# Callbacks (navigation mirrors the main app; the leaderboard renders as cards in the browser)
 @app.callback(
     [Output("page-content", "children"),
      Output("user-data", "data"),
      Output("app-state", "data")],
     [Input("login-btn", "n_clicks"),
      Input("view-leaderboard-btn", "n_clicks"),
-     Input("back-to-questions-btn", "n_clicks"),
-     Input("auto-refresh", "n_intervals")],
+     Input("back-to-questions-btn", "n_clicks")],
     [State("email-input", "value"),
      State("user-data", "data"),
-     State("app-state", "data")]
+     State("app-state", "data")],
+    # The layout already starts on the login form
+    prevent_initial_call=True
 )
-def handle_navigation(login_clicks, leaderboard_clicks, back_clicks, auto_refresh, email, user_data, app_state):
+def handle_navigation(login_clicks, leaderboard_clicks, back_clicks, email, user_data, app_state):
     """Handle navigation between pages."""
     ctx = dash.callback_context
     
@@ -216,125 +247,113 @@ def handle_navigation(login_clicks, leaderboard_clicks, back_clicks, auto_refres
     # Handle leaderboard view
     elif trigger_id == "view-leaderboard-btn" and leaderboard_clicks:
         app_state["page"] = "leaderboard"
-        return create_leaderboard(), user_data, app_state
+        return create_leaderboard(), dash.no_update, app_state
     
     # Handle back to questions
     elif trigger_id == "back-to-questions-btn" and back_clicks:
         app_state["page"] = "questions"
-        return create_questions_page(), user_data, app_state
-    
-    # Handle auto-refresh
-    elif trigger_id == "auto-refresh" and app_state and app_state.get("page") == "leaderboard":
-        return create_leaderboard(), user_data, app_state
+        return create_questions_page(), dash.no_update, app_state
     
     # Default state
     if not user_data:
         return create_login_form(), None, {"page": "login", "question_num": 1}
-    elif app_state.get("page") == "questions":
-        return create_questions_page(), user_data, app_state
-    elif app_state.get("page") == "leaderboard":
-        return create_leaderboard(), user_data, app_state
+    elif app_state.get("page") in ("questions", "leaderboard"):
+        # That page is already showing and nothing about the user changed
+        return dash.no_update, dash.no_update, dash.no_update
     else:
         return create_login_form(), None, {"page": "login", "question_num": 1}
 
 @app.callback(
     Output("questions-container", "children"),
-    Input("page-content", "children"),
-    State("app-state", "data")
+    Input("app-state", "data")
 )
-def load_questions(page_content, app_state):
+def load_questions(app_state):
     """Load questions when on the questions page."""
     if app_state and app_state.get("page") == "questions":
-        return [create_question_form(i) for i in range(1, len(WORKSHOP_QUESTIONS) + 1)]
+        return QUESTION_CARDS
     return []
 
 @app.callback(
-    Output("leaderboard-container", "children"),
-    [Input("page-content", "children"),
+    [Output("leaderboard-data", "data"),
+     Output("auto-refresh", "interval")],
+    [Input("app-state", "data"),
      Input("refresh-leaderboard-btn", "n_clicks"),
      Input("auto-refresh", "n_intervals")],
-    State("app-state", "data")
+    [State("leaderboard-data", "data"),
+     State("auto-refresh", "interval")]
 )
-def load_leaderboard(page_content, refresh_clicks, auto_refresh, app_state):
-    """Load and display the leaderboard."""
+def load_leaderboard(app_state, refresh_clicks, auto_refresh, current_data, interval):
+    """Load the leaderboard rows; the cards are rendered in the browser by renderCards."""
     if app_state and app_state.get("page") == "leaderboard":
         try:
             if response_manager:
                 leaderboard_df = response_manager.get_leaderboard()
-                
-                if not leaderboard_df.empty:
-                    # Create a more visual leaderboard
-                    leaderboard_components = []
-                    
-                    for i, row in leaderboard_df.iterrows():
-                        rank = i + 1
-                        medal = "🥇" if rank == 1 else "🥈" if rank == 2 else "🥉" if rank == 3 else f"#{rank}"
-                        
-                        card = dbc.Card([
-                            dbc.CardBody([
-                                dbc.Row([
-                                    dbc.Col([
-                                        html.H5(f"{medal} {row['display_name']}", className="mb-1"),
-                                        html.P(row['email'], className="text-muted mb-0")
-                                    ], width=8),
-                                    dbc.Col([
-                                        html.H4(f"{row['total_points']}", className="text-primary mb-0"),
-                                        html.P(f"{row['questions_answered']} questions", className="text-muted mb-0")
-                                    ], width=4, className="text-end")
-                                ])
-                            ])
-                        ], className="mb-2")
-                        
-                        leaderboard_components.append(card)
-                    
-                    return leaderboard_components
-                else:
-                    return [html.P("No scores yet. Be the first to answer questions!", className="text-center")]
+                data = {"rows": leaderboard_df[LEADERBOARD_ROW_COLUMNS].to_dict('records')}
             else:
-                return [html.P("Unable to load leaderboard. Please check your connection.", className="text-center")]
+                data = {"message": "Unable to load leaderboard. Please check your connection."}
         except Exception as e:
             logger.error(f"Error loading leaderboard: {str(e)}")
-            return [html.P("Error loading leaderboard.", className="text-center")]
+            data = {"message": "Error loading leaderboard."}
+        
+        if data != current_data or ctx.triggered_id != "auto-refresh":
+            # New standings or a manual refresh: poll at the normal rate again
+            return (dash.no_update if data == current_data else data), AUTO_REFRESH_INTERVAL
+        
+        # Nothing changed since the last tick: leave the rendered cards alone and poll less often
+        return dash.no_update, min(interval * 2, AUTO_REFRESH_MAX_INTERVAL)
     
-    return []
+    return dash.no_update, dash.no_update
 
-# Dynamic callbacks for question submissions
-for i in range(1, len(WORKSHOP_QUESTIONS) + 1):
-    @app.callback(
-        Output(f"question-{i}-feedback", "children"),
-        Input(f"submit-question-{i}", "n_clicks"),
-        [State(f"question-{i}-options", "value"),
-         State("user-data", "data")]
-    )
-    def submit_answer(n_clicks, selected_answer, user_data, question_num=i):
-        """Submit an answer for a question."""
-        if n_clicks and selected_answer and user_data:
-            try:
-                question = WORKSHOP_QUESTIONS[question_num - 1]
-                correct_answer = question["correct_answer"]
+# Leaderboard cards are built clientside from the rows (see assets/clientside.js)
+app.clientside_callback(
+    ClientsideFunction(namespace="leaderboard", function_name="renderCards"),
+    Output("leaderboard-container", "children"),
+    Input("leaderboard-data", "data")
+)
+
+# One pattern-matching callback handles the submit button of every question
+@app.callback(
+    [Output({"type": "question-feedback", "index": MATCH}, "children"),
+     Output({"type": "submit-question", "index": MATCH}, "disabled")],
+    Input({"type": "submit-question", "index": MATCH}, "n_clicks"),
+    [State({"type": "question-options", "index": MATCH}, "value"),
+     State("user-data", "data")],
+    # Nothing to submit when a question card is first rendered
+    prevent_initial_call=True,
+    # Block repeat clicks while the answer is being recorded
+    running=[(Output({"type": "submit-question", "index": MATCH}, "disabled"), True, False)]
+)
+def submit_answer(n_clicks, selected_answer, user_data):
+    """Submit an answer for a question."""
+    if n_clicks and selected_answer and user_data:
+        try:
+            question_num = ctx.triggered_id["index"]
+            correct_answer = QUESTIONS_BY_ID[question_num]["correct_answer"]
+            
+            if response_manager:
+                success = response_manager.submit_response(
+                    user_data["user_id"], 
+                    question_num, 
+                    selected_answer, 
+                    correct_answer
+                )
                 
-                if response_manager:
-                    success = response_manager.submit_response(
-                        user_data["user_id"], 
-                        question_num, 
-                        selected_answer, 
-                        correct_answer
-                    )
-                    
-                    if success:
-                        if selected_answer == correct_answer:
-                            return dbc.Alert("Correct! ✅", color="success")
-                        else:
-                            return dbc.Alert(f"Incorrect. The correct answer is: {correct_answer}", color="warning")
+                # A recorded answer disables the button, so the same answer isn't written twice
+                if success:
+                    if selected_answer == correct_answer:
+                        return dbc.Alert("Correct! ✅", color="success"), True
                     else:
-                        return dbc.Alert("Error submitting answer. Please try again.", color="danger")
+                        return dbc.Alert(f"Incorrect. The correct answer is: {correct_answer}", color="warning"), True
                 else:
-                    return dbc.Alert("Database connection error.", color="danger")
-            except Exception as e:
-                logger.error(f"Error submitting answer: {str(e)}")
-                return dbc.Alert("Error submitting answer.", color="danger")
-        
-        return ""
+                    return dbc.Alert("Error submitting answer. Please try again.", color="danger"), False
+            else:
+                return dbc.Alert("Database connection error.", color="danger"), False
+        except Exception as e:
+            logger.error(f"Error submitting answer: {str(e)}")
+            return dbc.Alert("Error submitting answer.", color="danger"), False
+    
+    # Incomplete submission: leave any earlier feedback untouched
+    return dash.no_update, dash.no_update
 
 if __name__ == "__main__":
     # Initialize the demo app